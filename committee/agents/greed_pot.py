@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, constr
+from pydantic import BaseModel, ConfigDict, Field, constr
 
 from committee.core.trace_logger import TraceLogger
 from committee.schemas.snapshot import Snapshot
@@ -34,8 +34,7 @@ class GreedPotHypothesis(BaseModel):
     invalidation_condition: ShortText
     confidence: ConfidenceText
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class GreedPotResult(BaseModel):
@@ -51,8 +50,7 @@ class GreedPotResult(BaseModel):
     fallback_used: bool = False
     error: str | None = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 @dataclass(frozen=True)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date
+from typing import Mapping
 
 from committee.core.database import (
     safe_upsert_daily_macro,
@@ -17,7 +18,7 @@ from committee.tools.bok_policy_rate_provider import check_bok_base_rate
 def persist_snapshot_metrics(
     snapshot: Snapshot,
     market_date: date,
-    status: dict[str, str],
+    status: Mapping[str, str],
 ) -> None:
     """Persist snapshot-derived metrics into DB (best-effort upsert)."""
     kospi_pct_db = snapshot.markets.kr.kospi_pct if status.get("kospi") == "OK" else None
@@ -101,7 +101,10 @@ class DailyPipeline:
         print("[pipeline] stage 1/6: build snapshot")
         snapshot = build_snapshot(market_date)
         status = get_last_snapshot_status()
-        trace.log("pipeline_stage", {"stage": "snapshot_built", "market_date": market_date.isoformat(), "status": status})
+        trace.log(
+            "pipeline_stage",
+            {"stage": "snapshot_built", "market_date": market_date.isoformat(), "status": dict(status)},
+        )
         persist_snapshot_metrics(snapshot=snapshot, market_date=market_date, status=status)
         print("[pipeline] stage 2/6: run pre-analysis")
         stances = run_pre_analysis(snapshot, self.agent_ids)
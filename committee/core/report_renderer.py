@@ -2,12 +2,14 @@ from __future__ import annotations
 
 # Report assembly and rendering utilities.
 
-import json
+from collections import Counter
 from datetime import datetime, timezone
+import os
 from pathlib import Path
-from typing import List
+import re
+from typing import Iterator, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from committee.schemas.committee_result import CommitteeResult
 from committee.schemas.debate import DebateRound
@@ -24,8 +26,8 @@ class Report(BaseModel):
     debate_round: DebateRound | None = None
     committee_result: CommitteeResult
 
-    class Config:
-        extra = "forbid"
+    # Reports are write-once pipeline outputs; freezing lets pydantic skip assignment bookkeeping.
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 def build_report(
@@ -35,84 +37,130 @@ def build_report(
     committee_result: CommitteeResult,
     debate_round: DebateRound | None = None,
 ) -> Report:
-    """Build a report from pipeline artifacts."""
-    return Report(
-        generated_at=datetime.now(timezone.utc).isoformat(),
-        market_date=market_date,
-        snapshot=snapshot,
-        stances=stances,
-        debate_round=debate_round,
-        committee_result=committee_result,
-    )
+    """Build a report from pipeline artifacts.
+
+    Inputs are already-validated models, so the report is assembled with model_construct.
+    Set REPORT_STRICT_VALIDATION=1 to run full pydantic validation instead (debugging).
+    """
+    fields = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "market_date": market_date,
+        "snapshot": snapshot,
+        "stances": stances,
+        "debate_round": debate_round,
+        "committee_result": committee_result,
+    }
+    if os.getenv("REPORT_STRICT_VALIDATION", "0").strip() == "1":
+        return Report(**fields)
+    return Report.model_construct(**fields)
 
 
 def render_report(report: Report, output_path: Path) -> None:
     """Write report JSON to disk."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(report.model_dump(), handle, ensure_ascii=False, indent=2)
-
-
-def build_report_markdown(report: Report) -> str:
-    """Render a structured markdown report focused on readability."""
-
-    def _fmt(value: float | None, digits: int = 2, suffix: str = "") -> str:
-        if value is None:
-            return "n/a"
-        try:
-            return f"{float(value):.{digits}f}{suffix}"
-        except Exception:
-            return "n/a"
-
-    def _fmt_signed(value: float | None, digits: int = 2, suffix: str = "") -> str:
-        if value is None:
-            return "n/a"
-        try:
-            return f"{float(value):+.{digits}f}{suffix}"
-        except Exception:
-            return "n/a"
-
-    lines = [
-        "# 데일리 AI 투자위원회 리포트",
-        "",
-        f"- 시장 기준일: **{report.market_date}**",
-        f"- 생성 시각(UTC): `{report.generated_at}`",
-        "",
-        "## 1) 한눈에 보기",
-        f"- **위원회 합의**: {_translate_sentence(report.committee_result.consensus)}",
-    ]
-
-    tag_counts = {"RISK_ON": 0, "NEUTRAL": 0, "RISK_OFF": 0}
-    for stance in report.stances:
-        tag_counts[stance.regime_tag.value] = tag_counts.get(stance.regime_tag.value, 0) + 1
-    majority_tag = max(tag_counts, key=lambda key: tag_counts[key])
-    lines.append(
-        f"- **국면 투표**: NEUTRAL={tag_counts['NEUTRAL']}, RISK_ON={tag_counts['RISK_ON']}, RISK_OFF={tag_counts['RISK_OFF']}"
+    # pydantic-core serializes the nested model tree straight to JSON in one pass,
+    # skipping the intermediate dict from model_dump() and the stdlib re-encode.
+    output_path.write_text(report.model_dump_json(indent=2), encoding="utf-8", newline="")
+
+
+_REGIME_TAGS = ("RISK_ON", "NEUTRAL", "RISK_OFF")
+
+_MD_HEADER = (
+    "# 데일리 AI 투자위원회 리포트\n"
+    "\n"
+    "- 시장 기준일: **{market_date}**\n"
+    "- 생성 시각(UTC): `{generated_at}`\n"
+    "\n"
+    "## 1) 한눈에 보기\n"
+    "- **위원회 합의**: {consensus}\n"
+    "- **국면 투표**: NEUTRAL={neutral}, RISK_ON={risk_on}, RISK_OFF={risk_off}\n"
+    "- **다수 국면**: {majority_tag}\n"
+    "\n"
+    "## 2) 운영 가이드"
+)
+_MD_MARKETS = (
+    "\n"
+    "## 3) 시장/매크로 스냅샷\n"
+    "- **국내 지수**: KOSPI {kospi_pct} / KOSDAQ {kosdaq_pct}\n"
+    "- **미국 지수**: S&P500 {sp500_pct} / NASDAQ {nasdaq_pct} / DOW {dow_pct}\n"
+    "- **환율/변동성**: USD/KRW {usdkrw} ({usdkrw_pct}) / VIX {vix}\n"
+    "- **시장 요약 노트**: {market_note}\n"
+    "- **수급 요약**: 외국인 {foreign_net}억 / 기관 {institution_net}억 / 개인 {retail_net}억"
+)
+_MD_MACRO = (
+    "- **일간 매크로**: 미10년 {us10y} / 미2년 {us2y} / 2-10 {spread_2_10} / DXY {dxy}\n"
+    "- **월간 매크로**: 실업률 {unemployment_rate} / CPI YoY {cpi_yoy} / Core CPI YoY {core_cpi_yoy} / PMI {pmi}\n"
+    "- **분기/구조**: GDP QoQ 연율 {gdp_qoq_annualized} / 기준금리 {fed_funds_rate} / 실질금리 {real_rate}"
+)
+_MD_STANCE = "### {agent_label}\n{comment}- 국면 태그: {regime_tag} / 신뢰도: {confidence}\n{claims}"
+_MD_DEBATE = (
+    "- 라운드: {round_index}\n"
+    "- 지표 활용 체크: {metric_minutes}/{minute_count}명이 수치형 지표 근거를 인용했습니다.\n"
+    "- 진행 메모: {facilitator_note}\n"
+    "{minutes}"
+    "- 라운드 결론: {round_conclusion}"
+)
+
+
+# Report is assembled with model_construct (unvalidated), so values are coerced with float() and
+# anything non-numeric renders as "n/a" instead of raising inside a format spec.
+def _fmt(value: float | None, digits: int = 2, suffix: str = "") -> str:
+    if value is None:
+        return "n/a"
+    try:
+        return f"{float(value):.{digits}f}{suffix}"
+    except (TypeError, ValueError):
+        return "n/a"
+
+
+def _fmt_signed(value: float | None, digits: int = 2, suffix: str = "") -> str:
+    if value is None:
+        return "n/a"
+    try:
+        return f"{float(value):+.{digits}f}{suffix}"
+    except (TypeError, ValueError):
+        return "n/a"
+
+
+def _iter_report_markdown(report: Report, include_debug: bool = False) -> Iterator[str]:
+    """Yield the markdown report blocks in order; callers join them with newlines."""
+    result = report.committee_result
+    # Seed the known tags first so ties resolve in RISK_ON > NEUTRAL > RISK_OFF order.
+    tag_counts = Counter(dict.fromkeys(_REGIME_TAGS, 0))
+    tag_counts.update(stance.regime_tag.value for stance in report.stances)
+    majority_tag = tag_counts.most_common(1)[0][0]
+
+    yield _MD_HEADER.format(
+        market_date=report.market_date,
+        generated_at=report.generated_at,
+        consensus=_translate_sentence(result.consensus),
+        neutral=tag_counts["NEUTRAL"],
+        risk_on=tag_counts["RISK_ON"],
+        risk_off=tag_counts["RISK_OFF"],
+        majority_tag=majority_tag,
     )
-    lines.append(f"- **다수 국면**: {majority_tag}")
-
-    lines.extend(["", "## 2) 운영 가이드"])
-    for guidance in report.committee_result.ops_guidance:
-        lines.append(
-            f"- [{guidance.level}/{_translate_level(guidance.level.value)}] {_translate_sentence(guidance.text)}"
-        )
-
-    lines.extend(["", "## 3) 시장/매크로 스냅샷"])
-    m = report.snapshot.markets
-    lines.append(
-        f"- **국내 지수**: KOSPI {_fmt_signed(m.kr.kospi_pct, 2, '%')} / KOSDAQ {_fmt_signed(m.kr.kosdaq_pct, 2, '%')}"
-    )
-    lines.append(
-        f"- **미국 지수**: S&P500 {_fmt_signed(m.us.sp500_pct, 2, '%')} / NASDAQ {_fmt_signed(m.us.nasdaq_pct, 2, '%')} / DOW {_fmt_signed(m.us.dow_pct, 2, '%')}"
-    )
-    lines.append(
-        f"- **환율/변동성**: USD/KRW {_fmt(m.fx.usdkrw, 2)} ({_fmt_signed(m.fx.usdkrw_pct, 2, '%')}) / VIX {_fmt(m.volatility.vix, 1)}"
+    yield from (
+        f"- [{guidance.level}/{_translate_level(guidance.level.value)}] {_translate_sentence(guidance.text)}"
+        for guidance in result.ops_guidance
     )
 
+    m = report.snapshot.markets
     s = report.snapshot.market_summary
     f = report.snapshot.flow_summary
-    lines.append(f"- **시장 요약 노트**: {s.note}")
-    lines.append(f"- **수급 요약**: 외국인 {_fmt_signed(f.foreign_net, 0)}억 / 기관 {_fmt_signed(f.institution_net, 0)}억 / 개인 {_fmt_signed(f.retail_net, 0)}억")
+    yield _MD_MARKETS.format(
+        kospi_pct=_fmt_signed(m.kr.kospi_pct, 2, "%"),
+        kosdaq_pct=_fmt_signed(m.kr.kosdaq_pct, 2, "%"),
+        sp500_pct=_fmt_signed(m.us.sp500_pct, 2, "%"),
+        nasdaq_pct=_fmt_signed(m.us.nasdaq_pct, 2, "%"),
+        dow_pct=_fmt_signed(m.us.dow_pct, 2, "%"),
+        usdkrw=_fmt(m.fx.usdkrw, 2),
+        usdkrw_pct=_fmt_signed(m.fx.usdkrw_pct, 2, "%"),
+        vix=_fmt(m.volatility.vix, 1),
+        market_note=s.note,
+        foreign_net=_fmt_signed(f.foreign_net, 0),
+        institution_net=_fmt_signed(f.institution_net, 0),
+        retail_net=_fmt_signed(f.retail_net, 0),
+    )
 
     if report.snapshot.macro is not None:
         macro = report.snapshot.macro
@@ -120,140 +168,180 @@ def build_report_markdown(report: Report) -> str:
         mth = macro.monthly
         q = macro.quarterly
         st = macro.structural
-        lines.append(
-            f"- **일간 매크로**: 미10년 {_fmt(d.us10y, 2, '%')} / 미2년 {_fmt(d.us2y, 2, '%')} / 2-10 {_fmt(d.spread_2_10, 2, '%p')} / DXY {_fmt(d.dxy, 2)}"
+        yield _MD_MACRO.format(
+            us10y=_fmt(d.us10y, 2, "%"),
+            us2y=_fmt(d.us2y, 2, "%"),
+            spread_2_10=_fmt(d.spread_2_10, 2, "%p"),
+            dxy=_fmt(d.dxy, 2),
+            unemployment_rate=_fmt(mth.unemployment_rate, 2, "%"),
+            cpi_yoy=_fmt(mth.cpi_yoy, 2, "%"),
+            core_cpi_yoy=_fmt(mth.core_cpi_yoy, 2, "%"),
+            pmi=_fmt(mth.pmi, 1),
+            gdp_qoq_annualized=_fmt(q.gdp_qoq_annualized, 2, "%"),
+            fed_funds_rate=_fmt(st.fed_funds_rate, 2, "%"),
+            real_rate=_fmt(st.real_rate, 2, "%"),
         )
-        lines.append(
-            f"- **월간 매크로**: 실업률 {_fmt(mth.unemployment_rate, 2, '%')} / CPI YoY {_fmt(mth.cpi_yoy, 2, '%')} / Core CPI YoY {_fmt(mth.core_cpi_yoy, 2, '%')} / PMI {_fmt(mth.pmi, 1)}"
+
+    yield "\n## 4) 위원회 핵심 포인트"
+    yield from (
+        f"- {_translate_phrase(key_point.point)}\n  ↳ 출처: `{', '.join(key_point.sources)}`"
+        for key_point in result.key_points
+    )
+
+    yield "\n## 5) AI 에이전트 의견"
+    yield from (
+        _MD_STANCE.format(
+            agent_label=_agent_label(stance.agent_name.value),
+            comment=f"- 한줄 요약: {stance.korean_comment}\n" if stance.korean_comment else "",
+            regime_tag=stance.regime_tag.value,
+            confidence=stance.confidence.value,
+            claims="".join(f"- 핵심 주장: {claim}\n" for claim in stance.core_claims),
         )
-        lines.append(f"- **분기/구조**: GDP QoQ 연율 {_fmt(q.gdp_qoq_annualized, 2, '%')} / 기준금리 {_fmt(st.fed_funds_rate, 2, '%')} / 실질금리 {_fmt(st.real_rate, 2, '%')}")
-
-    lines.extend(["", "## 4) 위원회 핵심 포인트"])
-    for key_point in report.committee_result.key_points:
-        sources = ", ".join(key_point.sources)
-        lines.append(f"- {_translate_phrase(key_point.point)}")
-        lines.append(f"  ↳ 출처: `{sources}`")
-
-    lines.extend(["", "## 5) AI 에이전트 의견"])
-    for stance in report.stances:
-        agent_label = _agent_label(stance.agent_name.value)
-        lines.append(f"### {agent_label}")
-        if stance.korean_comment:
-            lines.append(f"- 한줄 요약: {stance.korean_comment}")
-        lines.append(f"- 국면 태그: {stance.regime_tag.value} / 신뢰도: {stance.confidence.value}")
-        for claim in stance.core_claims:
-            lines.append(f"- 핵심 주장: {claim}")
-        lines.append("")
-
-    lines.extend(["## 6) 에이전트 회의록(1라운드)"])
-    if report.debate_round is None:
-        lines.append("- 비활성화됨 (USE_AGENT_DEBATE=1 설정 시 활성화)")
+        for stance in report.stances
+    )
+
+    yield "## 6) 에이전트 회의록(1라운드)"
+    debate = report.debate_round
+    if debate is None:
+        yield "- 비활성화됨 (USE_AGENT_DEBATE=1 설정 시 활성화)"
     else:
         metric_minutes = sum(
             1
-            for minute in report.debate_round.minutes
+            for minute in debate.minutes
             if any(_has_numeric_payload(ref) for ref in minute.references)
         )
-        lines.append(f"- 라운드: {report.debate_round.round_index}")
-        lines.append(
-            f"- 지표 활용 체크: {metric_minutes}/{len(report.debate_round.minutes)}명이 수치형 지표 근거를 인용했습니다."
+        yield _MD_DEBATE.format(
+            round_index=debate.round_index,
+            metric_minutes=metric_minutes,
+            minute_count=len(debate.minutes),
+            facilitator_note=debate.facilitator_note,
+            minutes="".join(
+                f"- [{minute.speaker_label}] {minute.summary}\n  - 참조 근거: {', '.join(minute.references)}\n"
+                for minute in debate.minutes
+            ),
+            round_conclusion=debate.round_conclusion,
         )
-        lines.append(f"- 진행 메모: {report.debate_round.facilitator_note}")
-        for minute in report.debate_round.minutes:
-            lines.append(
-                f"- [{minute.speaker_label}] {minute.summary}"
-            )
-            lines.append(f"  - 참조 근거: {', '.join(minute.references)}")
-        lines.append(f"- 라운드 결론: {report.debate_round.round_conclusion}")
-
-    lines.extend(["", "## 7) 이견 사항"])
-    if not report.committee_result.disagreements:
-        lines.append("- 이견 없음")
+
+    yield "\n## 7) 이견 사항"
+    if not result.disagreements:
+        yield "- 이견 없음"
     else:
-        for disagreement in report.committee_result.disagreements:
-            agents = ", ".join(disagreement.minority_agents)
-            lines.append(
-                f"- {_translate_phrase(disagreement.topic)}: 다수={disagreement.majority}, 소수={disagreement.minority}, 에이전트=[{agents}]"
-            )
-            lines.append(f"  - 의미: {_translate_sentence(disagreement.why_it_matters)}")
-
-    lines.extend(["", "## 8) AI 원문 응답 (디버깅/검토용)"])
-    for stance in report.stances:
-        agent_label = _agent_label(stance.agent_name.value)
-        lines.append(f"### {agent_label}")
-        if stance.raw_response:
-            lines.append("```text")
-            lines.extend(stance.raw_response.splitlines())
-            lines.append("```")
-        else:
-            lines.append("(stub or raw response unavailable)")
-
-    return "\n".join(lines)
+        yield from (
+            f"- {_translate_phrase(disagreement.topic)}: 다수={disagreement.majority}, "
+            f"소수={disagreement.minority}, 에이전트=[{', '.join(disagreement.minority_agents)}]\n"
+            f"  - 의미: {_translate_sentence(disagreement.why_it_matters)}"
+            for disagreement in result.disagreements
+        )
+
+    if not include_debug:
+        # Raw LLM responses are already persisted in stances.json; skip the bulky echo.
+        return
+    yield "\n## 8) AI 원문 응답 (디버깅/검토용)"
+    yield from (
+        f"### {_agent_label(stance.agent_name.value)}\n"
+        + (
+            "```text\n" + "".join(f"{line}\n" for line in stance.raw_response.splitlines()) + "```"
+            if stance.raw_response
+            else "(stub or raw response unavailable)"
+        )
+        for stance in report.stances
+    )
+
+
+def build_report_markdown(report: Report, include_debug: bool = False) -> str:
+    """Render a structured markdown report focused on readability.
+
+    include_debug=True appends section 8 with each agent's raw LLM response.
+    """
+    return "\n".join(_iter_report_markdown(report, include_debug))
+
+
+def write_report_markdown(report: Report, output_path: Path, include_debug: bool = False) -> None:
+    """Stream the markdown report to disk block by block instead of building one string."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", encoding="utf-8", buffering=1 << 16) as handle:
+        blocks = _iter_report_markdown(report, include_debug)
+        handle.write(next(blocks))
+        for block in blocks:
+            handle.write("\n")
+            handle.write(block)
+
+
+_LEVEL_LABELS = {
+    "OK": "유지",
+    "CAUTION": "주의",
+    "AVOID": "회피",
+}
+
+# Ordered prefix translations; the first matching prefix wins.
+_PHRASE_PREFIXES = {
+    "Majority regime tag": "다수 국면 태그",
+    "Shared evidence focus": "공통 근거",
+    "Regime tags": "국면 태그",
+}
+# Anchored alternation keeps the ordered first-match semantics in a single C-level scan.
+_PHRASE_PREFIX_RE = re.compile("^(?:" + "|".join(map(re.escape, _PHRASE_PREFIXES)) + ")")
+
+_SENTENCE_TRANSLATIONS = {
+    "Committee agrees on a neutral stance with selective monitoring.": "위원회는 선별적 모니터링 하에 중립적 스탠스를 유지합니다.",
+    "Committee maintains a neutral posture with selective positioning.": "위원회는 선별적 포지셔닝을 전제로 중립적 입장을 유지합니다.",
+    "Committee adopts a defensive posture and reduces risk exposure.": "위원회는 방어적 입장을 채택하고 위험 노출을 줄입니다.",
+    "Committee supports risk-on positioning with disciplined risk controls.": "위원회는 엄격한 리스크 통제를 전제로 위험자산 비중 확대를 지지합니다.",
+    "No dissenting regime tags are present.": "다른 국면 태그의 이견은 없습니다.",
+    "Minority risk regime can change positioning boundaries.": "소수 의견 국면은 포지션 경계에 영향을 줄 수 있습니다.",
+    "Maintain balanced exposure.": "노출을 균형 있게 유지합니다.",
+    "Keep risk limits tight.": "리스크 한도를 엄격히 유지합니다.",
+    "Avoid aggressive leverage.": "과도한 레버리지는 피합니다.",
+    "Lean into confirmed momentum leaders.": "확인된 모멘텀 주도주 중심으로 대응합니다.",
+    "Size positions with volatility limits.": "변동성 한도를 기준으로 포지션 규모를 조절합니다.",
+    "Avoid chasing overstretched breakouts.": "과열된 돌파 구간 추격 매수는 피합니다.",
+    "Keep watchlist tight and avoid overexposure.": "관심 종목을 좁게 유지하고 과도한 노출을 피합니다.",
+    "Keep position sizes moderate.": "포지션 규모를 보수적으로 유지합니다.",
+}
+
+_AGENT_LABELS = {
+    "macro": "매크로 담당자",
+    "flow": "수급 담당자",
+    "sector": "섹터 담당자",
+    "risk": "리스크 담당자",
+    "earnings": "이익모멘텀 담당자",
+    "breadth": "브레드스 담당자",
+    "liquidity": "유동성 담당자",
+}
 
 
 def _translate_level(level: str) -> str:
     """Translate ops guidance level to Korean."""
-    return {
-        "OK": "유지",
-        "CAUTION": "주의",
-        "AVOID": "회피",
-    }.get(level, level)
+    return _LEVEL_LABELS.get(level, level)
 
 
 def _translate_phrase(text: str) -> str:
     """Translate common fixed phrases for readability."""
-    mapping = {
-        "Majority regime tag": "다수 국면 태그",
-        "Shared evidence focus": "공통 근거",
-        "Regime tags": "국면 태그",
-    }
-    for key, value in mapping.items():
-        if text.startswith(key):
-            return text.replace(key, value, 1)
-    return text
+    return _PHRASE_PREFIX_RE.sub(_replace_phrase_prefix, text, count=1)
+
+
+def _replace_phrase_prefix(match: re.Match[str]) -> str:
+    return _PHRASE_PREFIXES[match.group(0)]
 
 
 def _translate_sentence(text: str) -> str:
     """Translate known sentences or return original."""
-    mapping = {
-        "Committee agrees on a neutral stance with selective monitoring.": "위원회는 선별적 모니터링 하에 중립적 스탠스를 유지합니다.",
-        "Committee maintains a neutral posture with selective positioning.": "위원회는 선별적 포지셔닝을 전제로 중립적 입장을 유지합니다.",
-        "Committee adopts a defensive posture and reduces risk exposure.": "위원회는 방어적 입장을 채택하고 위험 노출을 줄입니다.",
-        "Committee supports risk-on positioning with disciplined risk controls.": "위원회는 엄격한 리스크 통제를 전제로 위험자산 비중 확대를 지지합니다.",
-        "No dissenting regime tags are present.": "다른 국면 태그의 이견은 없습니다.",
-        "Minority risk regime can change positioning boundaries.": "소수 의견 국면은 포지션 경계에 영향을 줄 수 있습니다.",
-        "Maintain balanced exposure.": "노출을 균형 있게 유지합니다.",
-        "Keep risk limits tight.": "리스크 한도를 엄격히 유지합니다.",
-        "Avoid aggressive leverage.": "과도한 레버리지는 피합니다.",
-        "Lean into confirmed momentum leaders.": "확인된 모멘텀 주도주 중심으로 대응합니다.",
-        "Size positions with volatility limits.": "변동성 한도를 기준으로 포지션 규모를 조절합니다.",
-        "Avoid chasing overstretched breakouts.": "과열된 돌파 구간 추격 매수는 피합니다.",
-        "Keep watchlist tight and avoid overexposure.": "관심 종목을 좁게 유지하고 과도한 노출을 피합니다.",
-        "Keep position sizes moderate.": "포지션 규모를 보수적으로 유지합니다.",
-    }
-    return mapping.get(text, text)
+    return _SENTENCE_TRANSLATIONS.get(text, text)
 
 
 def _agent_label(agent_name: str) -> str:
     """Map agent identifiers to 담당자 labels."""
-    mapping = {
-        "macro": "매크로 담당자",
-        "flow": "수급 담당자",
-        "sector": "섹터 담당자",
-        "risk": "리스크 담당자",
-        "earnings": "이익모멘텀 담당자",
-        "breadth": "브레드스 담당자",
-        "liquidity": "유동성 담당자",
-    }
-    return mapping.get(agent_name, agent_name)
+    return _AGENT_LABELS.get(agent_name, agent_name)
+
+
+_NUMERIC_REFERENCE_PREFIXES = (
+    "snapshot.flow_summary.",
+    "snapshot.market_summary.",
+    "snapshot.markets.",
+    "snapshot.macro.",
+    "snapshot.phase_two_signals.",
+)
 
 
 def _has_numeric_payload(reference: str) -> bool:
-    numeric_reference_prefixes = (
-        "snapshot.flow_summary.",
-        "snapshot.market_summary.",
-        "snapshot.markets.",
-        "snapshot.macro.",
-        "snapshot.phase_two_signals.",
-    )
-    return reference.startswith(numeric_reference_prefixes)
+    return reference.startswith(_NUMERIC_REFERENCE_PREFIXES)
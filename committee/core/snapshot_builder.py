@@ -6,6 +6,7 @@ from __future__ import annotations
 # is recorded in status and notes so the report can show which source failed.
 # Fallback values (0.0) are used because downstream (report, agents) expect numeric fields;
 # missing data is indicated via notes/status rather than omitting the key.
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import date
 import json
 import os
@@ -13,7 +14,12 @@ from pathlib import Path
 import re
 import sqlite3
 from statistics import mean, pstdev
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Mapping, TypeVar
 
+from committee.core.validators import TICKER_PATTERN
 from committee.schemas.snapshot import Snapshot
 from committee.tools.fallback_provider import FallbackProvider
 from committee.tools.http_provider import HttpProvider
@@ -57,6 +63,19 @@ from committee.tools.fred_structural_provider import (
 from committee.tools.bok_trade_provider import fetch_korea_export_yoy
 
 
+_PROVIDER_FETCH_WORKERS = 16
+_DEFAULT_PROVIDER_FETCH_TIMEOUT_SECS = 90.0
+_SNAPSHOT_CACHE_SIZE = 8
+# Same-day reruns reuse a complete build for this long, so hourly callers still see fresh data.
+_SNAPSHOT_CACHE_TTL_SECS = 600.0
+# Failures surfaced in market_summary.note when headline numbers are unavailable (fetch order).
+_MARKET_NOTE_FAILURE_KEYS = ("usdkrw", "kospi", "usdkrw_pct")
+# FallbackProvider is stateless, so one shared instance serves every build.
+_FALLBACK_PROVIDER = FallbackProvider()
+
+_T = TypeVar("_T")
+
+
 def build_snapshot(market_date: date) -> Snapshot:
     """Create a snapshot using the default real builder."""
     return build_snapshot_real(market_date)
@@ -65,12 +84,58 @@ def build_snapshot(market_date: date) -> Snapshot:
 def build_snapshot_real(
     market_date: date,
     provider: IDataProvider | None = None,
+    *,
+    refresh: bool = False,
 ) -> Snapshot:
-    """Build a snapshot using a data provider with fallback."""
+    """Build a snapshot using a data provider with fallback.
+
+    Complete builds (no FAIL status) are memoized per (market_date, provider) for
+    _SNAPSHOT_CACHE_TTL_SECS so same-day repeats skip the network. Pass refresh=True to rebuild
+    this key; clear_snapshot_cache() drops every entry.
+    """
+    key = (market_date.isoformat(), provider)
+    with _SNAPSHOT_CACHE_LOCK:
+        cached = None if refresh else _SNAPSHOT_CACHE.get(key)
+        if cached is not None and cached[0] <= time.monotonic():
+            cached = None
+        if cached is None:
+            _SNAPSHOT_CACHE.pop(key, None)
+    if cached is not None:
+        _, snapshot, status = cached
+    else:
+        snapshot, status = _build_snapshot_uncached(market_date, provider)
+        if "FAIL" not in status.values():
+            with _SNAPSHOT_CACHE_LOCK:
+                _SNAPSHOT_CACHE[key] = (time.monotonic() + _SNAPSHOT_CACHE_TTL_SECS, snapshot, dict(status))
+                while len(_SNAPSHOT_CACHE) > _SNAPSHOT_CACHE_SIZE:
+                    _SNAPSHOT_CACHE.pop(next(iter(_SNAPSHOT_CACHE)))
+    _set_last_status(dict(status))
+    # Callers may mutate the snapshot; hand out a copy so the cached entry stays pristine.
+    return snapshot.model_copy(deep=True)
+
+
+# (market_date ISO, provider) -> (monotonic expiry, snapshot, status); insertion order is age order.
+# The provider is part of the key (identity hash) and kept alive by the cache.
+_SNAPSHOT_CACHE: dict[tuple[str, IDataProvider | None], tuple[float, Snapshot, dict[str, str]]] = {}
+_SNAPSHOT_CACHE_LOCK = threading.Lock()
+
+
+def clear_snapshot_cache() -> None:
+    """Drop every memoized snapshot so the next build_snapshot_real call refetches."""
+    with _SNAPSHOT_CACHE_LOCK:
+        _SNAPSHOT_CACHE.clear()
+
+
+def _build_snapshot_uncached(
+    market_date: date,
+    provider: IDataProvider | None = None,
+) -> tuple[Snapshot, dict[str, str]]:
+    """Fetch all inputs and assemble the snapshot (no memoization), with this build's source status."""
     provider = provider or HttpProvider()
-    fallback = FallbackProvider()
+    fallback = _FALLBACK_PROVIDER
 
-    notes: list[str] = []
+    # Failure notes keyed by status key, so note assembly below is a lookup rather than a scan.
+    failures: dict[str, str] = {}
     status: dict[str, str] = {
         "usdkrw": "FAIL", "kospi": "FAIL", "flows": "FAIL", "headlines": "FAIL",
         "kosdaq": "FAIL", "sp500": "FAIL", "nasdaq": "FAIL", "dow": "FAIL", "usdkrw_pct": "FAIL",
@@ -106,35 +171,109 @@ def build_snapshot_real(
         "fed_balance_sheet": "FAIL",
     }
 
-    usdkrw, usdkrw_reason = _safe_value(provider.get_usdkrw, fallback.get_usdkrw)
-    kospi_change_pct, kospi_reason = _safe_value(provider.get_kospi_change_pct, fallback.get_kospi_change_pct)
-    flows, flows_reason = _safe_flows(provider, fallback)
-    headlines, headlines_reason = _safe_headlines(provider)
-
-    # Global markets: fetch with fallback; on failure use 0.0 and record reason in notes.
-    kosdaq_pct, kosdaq_reason = _safe_value(provider.get_kosdaq_change_pct, fallback.get_kosdaq_change_pct)
-    sp500_pct, sp500_reason = _safe_value(provider.get_sp500_change_pct, fallback.get_sp500_change_pct)
-    nasdaq_pct, nasdaq_reason = _safe_value(provider.get_nasdaq_change_pct, fallback.get_nasdaq_change_pct)
-    dow_pct, dow_reason = _safe_value(provider.get_dow_change_pct, fallback.get_dow_change_pct)
-    usdkrw_pct, usdkrw_pct_reason = _safe_value(provider.get_usdkrw_pct, fallback.get_usdkrw_pct)
-    kospi_level, _ = _safe_optional_value(provider.get_kospi_level)
-    kosdaq_level, _ = _safe_optional_value(provider.get_kosdaq_level)
-    sp500_level, _ = _safe_optional_value(provider.get_sp500_level)
-    nasdaq_level, _ = _safe_optional_value(provider.get_nasdaq_level)
-    dow_level, _ = _safe_optional_value(provider.get_dow_level)
+    # Provider and macro fetches are independent blocking HTTP calls, so fan them out on a thread
+    # pool: wall time becomes ~max(latency) instead of the sum. Each future keeps the _safe_* contract.
+    pool = ThreadPoolExecutor(max_workers=_PROVIDER_FETCH_WORKERS, thread_name_prefix="snapshot-fetch")
+    try:
+        usdkrw_future = pool.submit(_safe_value, provider.get_usdkrw, fallback.get_usdkrw)
+        kospi_future = pool.submit(_safe_value, provider.get_kospi_change_pct, fallback.get_kospi_change_pct)
+        flows_future = pool.submit(_safe_flows, provider, fallback)
+        headlines_future = pool.submit(_safe_headlines, provider)
+        kosdaq_future = pool.submit(_safe_value, provider.get_kosdaq_change_pct, fallback.get_kosdaq_change_pct)
+        sp500_future = pool.submit(_safe_value, provider.get_sp500_change_pct, fallback.get_sp500_change_pct)
+        nasdaq_future = pool.submit(_safe_value, provider.get_nasdaq_change_pct, fallback.get_nasdaq_change_pct)
+        dow_future = pool.submit(_safe_value, provider.get_dow_change_pct, fallback.get_dow_change_pct)
+        usdkrw_pct_future = pool.submit(_safe_value, provider.get_usdkrw_pct, fallback.get_usdkrw_pct)
+        kospi_level_future = pool.submit(_safe_optional_value, provider.get_kospi_level)
+        kosdaq_level_future = pool.submit(_safe_optional_value, provider.get_kosdaq_level)
+        sp500_level_future = pool.submit(_safe_optional_value, provider.get_sp500_level)
+        nasdaq_level_future = pool.submit(_safe_optional_value, provider.get_nasdaq_level)
+        dow_level_future = pool.submit(_safe_optional_value, provider.get_dow_level)
+        # Macro fetchers (yfinance/FRED/BOK) are best-effort and return None when unavailable.
+        macro_fetchers: dict[str, Callable[[], float | None]] = {
+            "us10y": fetch_us10y,
+            "us3m": fetch_us3m,
+            "us2y": fetch_us2y,
+            "vix": fetch_vix,
+            "dxy": fetch_dxy,
+            "usdkrw_macro": fetch_usdkrw,
+            "vix3m": fetch_vix3m,
+            "vix_term_spread": fetch_vix_term_spread,
+            "oil_wti": fetch_oil_wti,
+            "oil_brent": fetch_oil_brent,
+            "russell2000": fetch_russell2000,
+            "unemployment_rate": fetch_unemployment_rate,
+            "cpi_yoy": fetch_cpi_yoy,
+            "core_cpi_yoy": fetch_core_cpi_yoy,
+            "pce_yoy": fetch_pce_yoy,
+            "pmi": fetch_pmi,
+            "retail_sales_mom": fetch_retail_sales_mom,
+            "nfp_change": fetch_nfp_change,
+            "wage_level": fetch_wage_level,
+            "wage_yoy": fetch_wage_yoy,
+            "export_yoy": lambda: fetch_korea_export_yoy(market_date),
+            "real_gdp": fetch_real_gdp,
+            "gdp_qoq_annualized": fetch_gdp_growth,
+            "fed_funds_rate": fetch_fed_funds_rate,
+            "breakeven_10y": fetch_breakeven_10y,
+            "hy_oas": fetch_hy_oas,
+            "ig_oas": fetch_ig_oas,
+            "fed_balance_sheet": fetch_fed_balance_sheet,
+            "tga_balance": fetch_tga_balance,
+            "boj_rate": fetch_boj_rate,
+        }
+        macro_futures = {key: pool.submit(fetcher) for key, fetcher in macro_fetchers.items()}
+
+        deadline = time.monotonic() + _provider_fetch_timeout_secs()
+        usdkrw, usdkrw_reason = _await_fetch(
+            usdkrw_future, deadline, lambda: _safe_value(_timed_out_fetch, fallback.get_usdkrw)
+        )
+        kospi_change_pct, kospi_reason = _await_fetch(
+            kospi_future, deadline, lambda: _safe_value(_timed_out_fetch, fallback.get_kospi_change_pct)
+        )
+        flows, flows_reason = _await_fetch(flows_future, deadline, lambda: _safe_flows(_TimedOutProvider(), fallback))
+        headlines, headlines_reason = _await_fetch(
+            headlines_future, deadline, lambda: _safe_headlines(_TimedOutProvider())
+        )
+
+        # Global markets: fetch with fallback; on failure use 0.0 and record reason in notes.
+        kosdaq_pct, kosdaq_reason = _await_fetch(
+            kosdaq_future, deadline, lambda: _safe_value(_timed_out_fetch, fallback.get_kosdaq_change_pct)
+        )
+        sp500_pct, sp500_reason = _await_fetch(
+            sp500_future, deadline, lambda: _safe_value(_timed_out_fetch, fallback.get_sp500_change_pct)
+        )
+        nasdaq_pct, nasdaq_reason = _await_fetch(
+            nasdaq_future, deadline, lambda: _safe_value(_timed_out_fetch, fallback.get_nasdaq_change_pct)
+        )
+        dow_pct, dow_reason = _await_fetch(
+            dow_future, deadline, lambda: _safe_value(_timed_out_fetch, fallback.get_dow_change_pct)
+        )
+        usdkrw_pct, usdkrw_pct_reason = _await_fetch(
+            usdkrw_pct_future, deadline, lambda: _safe_value(_timed_out_fetch, fallback.get_usdkrw_pct)
+        )
+        kospi_level, _ = _await_fetch(kospi_level_future, deadline, lambda: _safe_optional_value(_timed_out_fetch))
+        kosdaq_level, _ = _await_fetch(kosdaq_level_future, deadline, lambda: _safe_optional_value(_timed_out_fetch))
+        sp500_level, _ = _await_fetch(sp500_level_future, deadline, lambda: _safe_optional_value(_timed_out_fetch))
+        nasdaq_level, _ = _await_fetch(nasdaq_level_future, deadline, lambda: _safe_optional_value(_timed_out_fetch))
+        dow_level, _ = _await_fetch(dow_level_future, deadline, lambda: _safe_optional_value(_timed_out_fetch))
+        macro_values = {key: _await_fetch(future, deadline, _no_value) for key, future in macro_futures.items()}
+    finally:
+        # Do not block on stragglers that already exceeded the deadline.
+        pool.shutdown(wait=False, cancel_futures=True)
 
     # Phase 1: daily macro (yfinance only). Missing values are None -> DB NULL.
-    us10y = fetch_us10y()
-    us3m = fetch_us3m()
-    us2y = fetch_us2y()
-    vix_value = fetch_vix()
-    dxy = fetch_dxy()
-    usdkrw_macro = fetch_usdkrw()
-    vix3m = fetch_vix3m()
-    vix_term_spread = fetch_vix_term_spread()
-    oil_wti = fetch_oil_wti()
-    oil_brent = fetch_oil_brent()
-    russell2000 = fetch_russell2000()
+    us10y = macro_values["us10y"]
+    us3m = macro_values["us3m"]
+    us2y = macro_values["us2y"]
+    vix_value = macro_values["vix"]
+    dxy = macro_values["dxy"]
+    usdkrw_macro = macro_values["usdkrw_macro"]
+    vix3m = macro_values["vix3m"]
+    vix_term_spread = macro_values["vix_term_spread"]
+    oil_wti = macro_values["oil_wti"]
+    oil_brent = macro_values["oil_brent"]
+    russell2000 = macro_values["russell2000"]
 
     # Legacy spread_2_10 is kept as 10Y-3M because legacy us2y was a ^IRX short-rate proxy.
     spread_2_10 = (us10y - us3m) if (us10y is not None and us3m is not None) else None
@@ -142,126 +281,107 @@ def build_snapshot_real(
     spread_10y_3m = spread_2_10
 
     # Phase 2: monthly macro (FRED). Missing FRED key -> None for all values.
-    unemployment_rate = fetch_unemployment_rate()
-    cpi_yoy = fetch_cpi_yoy()
-    core_cpi_yoy = fetch_core_cpi_yoy()
-    pce_yoy = fetch_pce_yoy()
-    pmi = fetch_pmi()
-    retail_sales_mom = fetch_retail_sales_mom()
-    nfp_change = fetch_nfp_change()
-    wage_level = fetch_wage_level()
-    wage_yoy = fetch_wage_yoy()
+    unemployment_rate = macro_values["unemployment_rate"]
+    cpi_yoy = macro_values["cpi_yoy"]
+    core_cpi_yoy = macro_values["core_cpi_yoy"]
+    pce_yoy = macro_values["pce_yoy"]
+    pmi = macro_values["pmi"]
+    retail_sales_mom = macro_values["retail_sales_mom"]
+    nfp_change = macro_values["nfp_change"]
+    wage_level = macro_values["wage_level"]
+    wage_yoy = macro_values["wage_yoy"]
     # Backward compatibility: keep wage_growth populated with the level series.
     wage_growth = wage_level
-    export_yoy = fetch_korea_export_yoy(market_date)
+    export_yoy = macro_values["export_yoy"]
 
     # Phase 3 quarterly macro (FRED).
-    real_gdp = fetch_real_gdp()
-    gdp_qoq_annualized = fetch_gdp_growth()
+    real_gdp = macro_values["real_gdp"]
+    gdp_qoq_annualized = macro_values["gdp_qoq_annualized"]
 
-    # Phase 4 structural (FRED) + derived real rate.
-    fed_funds_rate = fetch_fed_funds_rate()
-    breakeven_10y = fetch_breakeven_10y()
+    # Phase 4 structural (FRED) + derived real rate (computed once all fetches resolved).
+    fed_funds_rate = macro_values["fed_funds_rate"]
+    breakeven_10y = macro_values["breakeven_10y"]
     real_rate = (us10y - breakeven_10y) if (us10y is not None and breakeven_10y is not None) else None
-    hy_oas = fetch_hy_oas()
-    ig_oas = fetch_ig_oas()
-    fed_balance_sheet = fetch_fed_balance_sheet()
-    tga_balance = fetch_tga_balance()
-    boj_rate = fetch_boj_rate()
-
-    if usdkrw_reason is None:
-        status["usdkrw"] = "OK"
-    else:
-        notes.append(f"usdkrw_fetch_failed: {usdkrw_reason}")
-    if kospi_reason is None:
-        status["kospi"] = "OK"
-    else:
-        notes.append(f"kospi_change_pct_fetch_failed: {kospi_reason}")
-    if flows_reason is None:
-        status["flows"] = "OK"
-    else:
-        if str(flows_reason).startswith("unavailable"):
-            status["flows"] = "OFF"
+    hy_oas = macro_values["hy_oas"]
+    ig_oas = macro_values["ig_oas"]
+    fed_balance_sheet = macro_values["fed_balance_sheet"]
+    tga_balance = macro_values["tga_balance"]
+    boj_rate = macro_values["boj_rate"]
+
+    if flows_reason is not None and str(flows_reason).startswith("unavailable"):
+        status["flows"] = "OFF"
+    # (status key, note label, reason); failure reasons go to notes so report can show them.
+    provider_results = (
+        ("usdkrw", "usdkrw_fetch_failed", usdkrw_reason),
+        ("kospi", "kospi_change_pct_fetch_failed", kospi_reason),
         # IMPORTANT: Avoid leaking KRX internal identifiers (e.g., "MDC", "STK", "KSQ")
         # into notes because the ticker-guard validator treats ALLCAPS tokens as tickers.
-        notes.append(f"flows_fetch_failed: {_sanitize_ticker_like_tokens(flows_reason)}")
-    if headlines_reason is None:
-        status["headlines"] = "OK"
-    else:
-        notes.append(f"headlines_fetch_failed: {headlines_reason}")
-    # Status for new markets keys; failure reasons go to notes so report can show them.
-    if kosdaq_reason is None:
-        status["kosdaq"] = "OK"
-    else:
-        notes.append(f"kosdaq_fetch_failed: {kosdaq_reason}")
-    if sp500_reason is None:
-        status["sp500"] = "OK"
-    else:
-        notes.append(f"sp500_fetch_failed: {sp500_reason}")
-    if nasdaq_reason is None:
-        status["nasdaq"] = "OK"
-    else:
-        notes.append(f"nasdaq_fetch_failed: {nasdaq_reason}")
-    if dow_reason is None:
-        status["dow"] = "OK"
-    else:
-        notes.append(f"dow_fetch_failed: {dow_reason}")
-    if usdkrw_pct_reason is None:
-        status["usdkrw_pct"] = "OK"
-    else:
-        notes.append(f"usdkrw_pct_fetch_failed: {usdkrw_pct_reason}")
+        ("flows", "flows_fetch_failed", None if flows_reason is None else _sanitize_ticker_like_tokens(flows_reason)),
+        ("headlines", "headlines_fetch_failed", headlines_reason),
+        ("kosdaq", "kosdaq_fetch_failed", kosdaq_reason),
+        ("sp500", "sp500_fetch_failed", sp500_reason),
+        ("nasdaq", "nasdaq_fetch_failed", nasdaq_reason),
+        ("dow", "dow_fetch_failed", dow_reason),
+        ("usdkrw_pct", "usdkrw_pct_fetch_failed", usdkrw_pct_reason),
+    )
+    for status_key, note_label, reason in provider_results:
+        if reason is None:
+            status[status_key] = "OK"
+        else:
+            failures[status_key] = f"{note_label}: {reason}"
 
     if vix_value is not None:
         status["vix"] = "OK"
         vix = float(vix_value)
     else:
         # Keep snapshot stable with a numeric value, but DB will store NULL when status != OK.
-        notes.append("vix_fetch_failed: unavailable")
+        failures["vix"] = "vix_fetch_failed: unavailable"
         vix = 0.0
 
-    # Phase 1 macro status updates (daily only).
-    status["us10y"] = "OK" if us10y is not None else "FAIL"
-    status["us2y"] = "OK" if us2y is not None else "FAIL"
-    status["us3m"] = "OK" if us3m is not None else "FAIL"
-    status["dxy"] = "OK" if dxy is not None else "FAIL"
-    status["usdkrw_macro"] = "OK" if usdkrw_macro is not None else "FAIL"
-    status["spread_2_10"] = "OK" if spread_2_10 is not None else "FAIL"
-    status["vix3m"] = "OK" if vix3m is not None else "FAIL"
-    status["vix_term_spread"] = "OK" if vix_term_spread is not None else "FAIL"
-    status["oil_wti"] = "OK" if oil_wti is not None else "FAIL"
-    status["oil_brent"] = "OK" if oil_brent is not None else "FAIL"
-    status["russell2000"] = "OK" if russell2000 is not None else "FAIL"
-
-    # Phase 2 monthly status tracking (FAIL when missing/unavailable).
-    status["unemployment_rate"] = "OK" if unemployment_rate is not None else "FAIL"
-    status["cpi_yoy"] = "OK" if cpi_yoy is not None else "FAIL"
-    status["core_cpi_yoy"] = "OK" if core_cpi_yoy is not None else "FAIL"
-    status["pce_yoy"] = "OK" if pce_yoy is not None else "FAIL"
-    status["pmi"] = "OK" if pmi is not None else "FAIL"
-    status["retail_sales_mom"] = "OK" if retail_sales_mom is not None else "FAIL"
-    status["nfp_change"] = "OK" if nfp_change is not None else "FAIL"
-    status["wage_growth"] = "OK" if wage_growth is not None else "FAIL"
-    status["wage_level"] = "OK" if wage_level is not None else "FAIL"
-    status["wage_yoy"] = "OK" if wage_yoy is not None else "FAIL"
-    status["export_yoy"] = "OK" if export_yoy is not None else "FAIL"
+    # Macro status: OK when a value is present, FAIL when missing/unavailable (stored as NULL).
+    macro_results = (
+        # Phase 1: daily.
+        ("us10y", us10y),
+        ("us2y", us2y),
+        ("us3m", us3m),
+        ("dxy", dxy),
+        ("usdkrw_macro", usdkrw_macro),
+        ("spread_2_10", spread_2_10),
+        ("vix3m", vix3m),
+        ("vix_term_spread", vix_term_spread),
+        ("oil_wti", oil_wti),
+        ("oil_brent", oil_brent),
+        ("russell2000", russell2000),
+        # Phase 2: monthly.
+        ("unemployment_rate", unemployment_rate),
+        ("cpi_yoy", cpi_yoy),
+        ("core_cpi_yoy", core_cpi_yoy),
+        ("pce_yoy", pce_yoy),
+        ("pmi", pmi),
+        ("retail_sales_mom", retail_sales_mom),
+        ("nfp_change", nfp_change),
+        ("wage_growth", wage_growth),
+        ("wage_level", wage_level),
+        ("wage_yoy", wage_yoy),
+        ("export_yoy", export_yoy),
+        # Phase 3: quarterly.
+        ("real_gdp", real_gdp),
+        ("gdp_qoq_annualized", gdp_qoq_annualized),
+        # Phase 4: structural.
+        ("fed_funds_rate", fed_funds_rate),
+        ("breakeven_10y", breakeven_10y),
+        ("real_rate", real_rate),
+        ("hy_oas", hy_oas),
+        ("ig_oas", ig_oas),
+        ("fed_balance_sheet", fed_balance_sheet),
+        ("tga_balance", tga_balance),
+        ("boj_rate", boj_rate),
+    )
+    for status_key, value in macro_results:
+        status[status_key] = "OK" if value is not None else "FAIL"
     if pmi is None:
         # Document which sources were attempted so failures are traceable.
-        notes.append(f"pmi_fetch_failed: tried={','.join(pmi_series_ids_tried())}")
-
-    # Phase 3 quarterly status.
-    status["real_gdp"] = "OK" if real_gdp is not None else "FAIL"
-    status["gdp_qoq_annualized"] = "OK" if gdp_qoq_annualized is not None else "FAIL"
-
-    # Phase 4 structural status.
-    status["fed_funds_rate"] = "OK" if fed_funds_rate is not None else "FAIL"
-    status["breakeven_10y"] = "OK" if breakeven_10y is not None else "FAIL"
-    status["real_rate"] = "OK" if real_rate is not None else "FAIL"
-    status["hy_oas"] = "OK" if hy_oas is not None else "FAIL"
-    status["ig_oas"] = "OK" if ig_oas is not None else "FAIL"
-    status["fed_balance_sheet"] = "OK" if fed_balance_sheet is not None else "FAIL"
-    status["tga_balance"] = "OK" if tga_balance is not None else "FAIL"
-    status["boj_rate"] = "OK" if boj_rate is not None else "FAIL"
-    _set_last_status(status)
+        failures["pmi"] = f"pmi_fetch_failed: tried={','.join(pmi_series_ids_tried())}"
 
     if usdkrw != 0.0 or kospi_change_pct != 0.0:
         headlines_state = "Headlines loaded." if headlines_reason is None else "Headlines unavailable."
@@ -271,12 +391,10 @@ def build_snapshot_real(
             f"{headlines_state} {flows_state}"
         )
     else:
-        market_note = "; ".join(
-            [note for note in notes if note.startswith("usdkrw") or note.startswith("kospi")]
-        )
+        market_note = "; ".join(failures[key] for key in _MARKET_NOTE_FAILURE_KEYS if key in failures)
     korean_market_flow = flows.get("korean_market_flow") if isinstance(flows, dict) else None
 
-    flow_error = "; ".join([n for n in notes if n.startswith("flows")])
+    flow_error = failures.get("flows", "")
     if flow_error:
         flow_note = f"{flow_error} (외국인/기관/개인 순매수는 데이터 없음)"
     else:
@@ -340,7 +458,7 @@ def build_snapshot_real(
         lookback_days=20,
     )
 
-    return Snapshot(
+    snapshot = Snapshot(
         market_summary={
             "note": market_note or "market_summary_note_unavailable",
             "kospi_change_pct": kospi_change_pct,
@@ -406,6 +524,11 @@ def build_snapshot_real(
             },
         },
     )
+    return snapshot, status
+
+
+_POSITIVE_EARNINGS_TOKENS = ("earnings beat", "guidance up", "estimate up", "eps beat", "upgrade")
+_NEGATIVE_EARNINGS_TOKENS = ("earnings miss", "guidance cut", "estimate down", "eps miss", "downgrade")
 
 
 def _compute_phase_two_signals(
@@ -416,12 +539,14 @@ def _compute_phase_two_signals(
 ) -> dict:
     """Build derived earnings/breadth/liquidity signals from existing inputs only."""
     headline_text = " ".join(headlines).lower()
-    positive = sum(token in headline_text for token in ["earnings beat", "guidance up", "estimate up", "eps beat", "upgrade"])
-    negative = sum(token in headline_text for token in ["earnings miss", "guidance cut", "estimate down", "eps miss", "downgrade"])
+    positive = sum(token in headline_text for token in _POSITIVE_EARNINGS_TOKENS)
+    negative = sum(token in headline_text for token in _NEGATIVE_EARNINGS_TOKENS)
     earnings_score = float(positive - negative)
 
-    kr = (markets.get("kr") or {}) if isinstance(markets, dict) else {}
-    us = (markets.get("us") or {}) if isinstance(markets, dict) else {}
+    if not isinstance(markets, dict):
+        markets = {}
+    kr = markets.get("kr") or {}
+    us = markets.get("us") or {}
     kr_avg = (float(kr.get("kospi_pct", 0.0)) + float(kr.get("kosdaq_pct", 0.0))) / 2.0
     us_avg = (
         float(us.get("sp500_pct", 0.0))
@@ -659,7 +784,7 @@ def _pct_change(rows: list[dict], key: str) -> float:
 
 def build_dummy_snapshot(market_date: date) -> Snapshot:
     """Return a deterministic snapshot without external dependencies."""
-    fallback = FallbackProvider()
+    fallback = _FALLBACK_PROVIDER
     usdkrw, _ = fallback.get_usdkrw()
     kospi_change_pct, _ = fallback.get_kospi_change_pct()
     # Dummy markets: all 0.0 to keep pipeline and JSON structure intact.
@@ -694,9 +819,50 @@ def build_dummy_snapshot(market_date: date) -> Snapshot:
     )
 
 
-def get_last_snapshot_status() -> dict[str, str]:
-    """Return the most recent snapshot source status."""
-    return dict(_LAST_STATUS)
+def get_last_snapshot_status() -> Mapping[str, str]:
+    """Return the status of this thread's last build, else the latest from any thread (read-only).
+
+    Preferring the calling thread's own build keeps a concurrent build on another thread from
+    swapping in its status between build_snapshot() and this call.
+    """
+    status = getattr(_THREAD_STATUS, "status", None)
+    return status if status is not None else _LAST_STATUS
+
+
+def _provider_fetch_timeout_secs() -> float:
+    """Overall wait budget for parallel provider fetches (env: SNAPSHOT_FETCH_TIMEOUT_SECS)."""
+    raw = os.getenv("SNAPSHOT_FETCH_TIMEOUT_SECS", "").strip()
+    try:
+        value = float(raw) if raw else _DEFAULT_PROVIDER_FETCH_TIMEOUT_SECS
+    except ValueError:
+        return _DEFAULT_PROVIDER_FETCH_TIMEOUT_SECS
+    return value if value > 0 else _DEFAULT_PROVIDER_FETCH_TIMEOUT_SECS
+
+
+def _await_fetch(future: Future, deadline: float, on_timeout: Callable[[], _T]) -> _T:
+    """Wait for a submitted fetch until the shared deadline; use on_timeout() when it expires."""
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FutureTimeoutError:
+        future.cancel()
+        return on_timeout()
+
+
+def _no_value() -> None:
+    """Timeout result for best-effort macro fetchers (stored as NULL like any other miss)."""
+    return None
+
+
+def _timed_out_fetch(*_args, **_kwargs):
+    """Fetcher stand-in used once a provider call exceeded the fetch deadline."""
+    raise TimeoutError("fetch_timeout")
+
+
+class _TimedOutProvider:
+    """Provider stand-in whose flow/headline calls report a fetch timeout."""
+
+    get_flows = staticmethod(_timed_out_fetch)
+    get_headlines = staticmethod(_timed_out_fetch)
 
 
 def _safe_value(fetcher, fallback_fetcher) -> tuple[float, str | None]:
@@ -757,8 +923,12 @@ def _sanitize_ticker_like_tokens(text: str | None) -> str:
     """Lowercase ticker-like ALLCAPS tokens to avoid validator false positives."""
     if not text:
         return "unavailable"
-    # Matches the same pattern as validators.TICKER_PATTERN, so we neutralize those tokens.
-    return re.sub(r"\b[A-Z][A-Z0-9]{1,11}\b", lambda m: m.group(0).lower(), str(text))
+    # Uses validators.TICKER_PATTERN itself, so exactly the tokens it would flag are neutralized.
+    return TICKER_PATTERN.sub(_lowercase_match, str(text))
+
+
+def _lowercase_match(match: re.Match[str]) -> str:
+    return match.group(0).lower()
 
 
 def _safe_headlines(provider: IDataProvider) -> tuple[list[str], str | None]:
@@ -784,10 +954,15 @@ def _safe_headlines(provider: IDataProvider) -> tuple[list[str], str | None]:
         return ["headline_unavailable"], str(exc) if str(exc) else "unavailable"
 
 
-_LAST_STATUS: dict[str, str] = {}
+# Replaced (never mutated) on each build, so a view handed out earlier keeps its own build's status.
+# The module-wide value is last-writer-wins across threads; _THREAD_STATUS holds each thread's own.
+_LAST_STATUS: Mapping[str, str] = MappingProxyType({})
+_THREAD_STATUS = threading.local()
 
 
 def _set_last_status(status: dict[str, str]) -> None:
-    """Store the latest snapshot source status."""
-    _LAST_STATUS.clear()
-    _LAST_STATUS.update(status)
+    """Store the latest snapshot source status for this thread and module-wide."""
+    global _LAST_STATUS  # noqa: PLW0603
+    view = MappingProxyType(dict(status))
+    _THREAD_STATUS.status = view
+    _LAST_STATUS = view
@@ -2,17 +2,19 @@ from __future__ import annotations
 
 # Storage utilities for run artifacts.
 
-import json
+import os
 from datetime import date
 from pathlib import Path
 from typing import List
 
-from committee.core.report_renderer import Report, build_report_markdown
+from pydantic import BaseModel
+
+from committee.core.report_renderer import Report, write_report_markdown
 from committee.agents.greed_pot import GreedPotResult
 from committee.schemas.committee_result import CommitteeResult
 from committee.schemas.debate import DebateRound
 from committee.schemas.snapshot import Snapshot
-from committee.schemas.stance import Stance
+from committee.schemas.stance import STANCE_LIST_ADAPTER, Stance
 
 
 def save_run(
@@ -29,21 +31,23 @@ def save_run(
     run_dir = base_dir / market_date.isoformat()
     run_dir.mkdir(parents=True, exist_ok=True)
 
-    _write_json(run_dir / "snapshot.json", snapshot.model_dump())
-    _write_json(run_dir / "stances.json", [stance.model_dump() for stance in stances])
+    # pydantic-core serializes each model straight to JSON text; no intermediate dicts.
+    _write_model_json(run_dir / "snapshot.json", snapshot)
+    (run_dir / "stances.json").write_text(
+        STANCE_LIST_ADAPTER.dump_json(stances, indent=2).decode("utf-8"), encoding="utf-8"
+    )
     if debate_round is not None:
-        _write_json(run_dir / "debate_round.json", debate_round.model_dump())
-    _write_json(run_dir / "committee_result.json", committee_result.model_dump())
+        _write_model_json(run_dir / "debate_round.json", debate_round)
+    _write_model_json(run_dir / "committee_result.json", committee_result)
     if greed_pot is not None:
-        _write_json(run_dir / "greed_pot.json", greed_pot.model_dump())
+        _write_model_json(run_dir / "greed_pot.json", greed_pot)
 
-    report_md = build_report_markdown(report)
-    (run_dir / "report.md").write_text(report_md, encoding="utf-8")
+    include_debug = os.getenv("REPORT_MARKDOWN_DEBUG", "0").strip() == "1"
+    write_report_markdown(report, run_dir / "report.md", include_debug=include_debug)
 
     return run_dir
 
 
-def _write_json(path: Path, payload: dict | list) -> None:
-    """Write JSON payload to disk."""
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False, indent=2)
+def _write_model_json(path: Path, model: BaseModel) -> None:
+    """Write a pydantic model straight to JSON, skipping the intermediate dict."""
+    path.write_text(model.model_dump_json(indent=2), encoding="utf-8")
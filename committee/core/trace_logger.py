@@ -5,14 +5,53 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+import threading
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json.
+    orjson = None
+
+
+def _encode_line(record: dict[str, Any]) -> bytes:
+    """Encode one trace record as a UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _noop_log(event: str, payload: dict[str, Any]) -> None:
+    """Discard a trace event (tracing disabled)."""
+    return None
 
 
 class TraceLogger:
-    """Append-only JSONL logger for execution traces."""
+    """Append-only JSONL logger for execution traces.
+
+    When no path is configured (e.g. `LLM_TRACE_PATH` unset), `log` is rebound to a
+    no-op at construction time so call sites never build/serialize trace records.
+    The file is opened once on the first event and kept open; each event is one
+    buffered write plus flush, so lines are on disk as soon as `log` returns.
+    """
 
     def __init__(self, path: str | Path | None):
         self.path = Path(path) if path else None
+        self._handle: BinaryIO | None = None
+        self._lock = threading.Lock()
+        if self.path is None:
+            self.log = _noop_log  # type: ignore[method-assign]
+
+    def __enter__(self) -> "TraceLogger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # __init__ may have raised before _lock was set; close() would then fail in the finalizer.
+        if getattr(self, "_lock", None) is not None:
+            self.close()
 
     def enabled(self) -> bool:
         return self.path is not None
@@ -21,11 +60,22 @@ class TraceLogger:
         """Write one trace event as JSON line."""
         if self.path is None:
             return
-        self.path.parent.mkdir(parents=True, exist_ok=True)
         record = {
             "ts": datetime.now(timezone.utc).isoformat(),
             "event": event,
             **payload,
         }
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        line = _encode_line(record)
+        with self._lock:
+            if self._handle is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._handle = self.path.open("ab")
+            self._handle.write(line)
+            self._handle.flush()
+
+    def close(self) -> None:
+        """Close the trace file handle (safe to call repeatedly; a later `log` reopens it)."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
@@ -2,15 +2,16 @@ from __future__ import annotations
 
 # Validation safeguards for MVP pipeline outputs.
 
+from itertools import chain
 import re
-from typing import Iterable, List, Sequence
+from typing import Iterable, Iterator, List, Sequence
 
 from pydantic import ValidationError
 
 from committee.core.report_renderer import Report
 from committee.schemas.committee_result import CommitteeResult
 from committee.schemas.snapshot import Snapshot
-from committee.schemas.stance import Stance
+from committee.schemas.stance import STANCE_LIST_ADAPTER, Stance
 
 
 FORBIDDEN_PHRASES = [
@@ -20,7 +21,7 @@ FORBIDDEN_PHRASES = [
     "확정 수익",
 ]
 
-ALLOWED_EVIDENCE_IDS = {
+ALLOWED_EVIDENCE_IDS = frozenset({
     "snapshot.market_summary.note",
     "snapshot.market_summary.usdkrw",
     "snapshot.market_summary.kospi_change_pct",
@@ -50,9 +51,9 @@ ALLOWED_EVIDENCE_IDS = {
     "snapshot.cumulative_context.vix_5d_avg",
     "snapshot.cumulative_context.reversal_signal",
     "snapshot.cumulative_context.note",
-}
+})
 
-ALLOWED_NON_TICKER_TOKENS = {
+ALLOWED_NON_TICKER_TOKENS = frozenset({
     # Region/market labels frequently present in headlines (not tickers).
     "US",
     "KR",
@@ -83,69 +84,80 @@ ALLOWED_NON_TICKER_TOKENS = {
     # KRX internal market codes (not tickers). May appear in flow error notes.
     "STK",  # KOSPI market id in KRX payloads
     "KSQ",  # KOSDAQ market id in KRX payloads
-}
+})
 
 TICKER_PATTERN = re.compile(r"\b[A-Z][A-Z0-9]{1,11}\b")
+# Cheap necessary condition for TICKER_PATTERN: all-Korean output skips the word-boundary scan.
+_TICKER_PROBE = re.compile(r"[A-Z][A-Z0-9]")
+
+# One case-insensitive alternation over all forbidden phrases, scanned once over the joined texts.
+_FORBIDDEN_PHRASE_PATTERN = re.compile("|".join(re.escape(phrase) for phrase in FORBIDDEN_PHRASES), re.IGNORECASE)
+_FORBIDDEN_PHRASE_BY_LOWER = {phrase.lower(): phrase for phrase in FORBIDDEN_PHRASES}
+# Texts are joined with a newline: no phrase contains one and it is a regex word boundary,
+# so matches can never span two fields.
+_TEXT_SEPARATOR = "\n"
 
 
 def _assert_no_forbidden_phrases(texts: Iterable[str]) -> None:
     """Reject forbidden phrases in any text field."""
-    for text in texts:
-        lowered = text.lower()
-        for phrase in FORBIDDEN_PHRASES:
-            if phrase.lower() in lowered:
-                raise ValueError(f"Forbidden phrase detected: {phrase}")
-
-
-def _extract_text_fields(snapshot: Snapshot, stances: Sequence[Stance], result: CommitteeResult) -> List[str]:
-    """Collect text fields for safety checks."""
-    texts: List[str] = []
-    texts.extend([snapshot.market_summary.note, snapshot.flow_summary.note])
-    texts.extend(snapshot.sector_moves)
-    texts.extend(snapshot.news_headlines)
+    _assert_no_forbidden_phrases_in(_TEXT_SEPARATOR.join(texts))
+
+
+def _assert_no_forbidden_phrases_in(joined: str) -> None:
+    """Reject forbidden phrases in already-joined text."""
+    match = _FORBIDDEN_PHRASE_PATTERN.search(joined)
+    if match is not None:
+        raise ValueError(f"Forbidden phrase detected: {_FORBIDDEN_PHRASE_BY_LOWER[match.group(0).lower()]}")
+
+
+def _iter_generated_text_fields(
+    snapshot: Snapshot, stances: Sequence[Stance], result: CommitteeResult
+) -> Iterator[str]:
+    """Yield text authored by our code or the agents (summary notes, stances, committee result)."""
+    yield snapshot.market_summary.note
+    yield snapshot.flow_summary.note
     for stance in stances:
-        texts.extend(stance.core_claims)
-        texts.append(stance.korean_comment)
-    texts.append(result.consensus)
+        yield from stance.core_claims
+        yield stance.korean_comment
+    yield result.consensus
     for key_point in result.key_points:
-        texts.append(key_point.point)
-        texts.extend(key_point.sources)
+        yield key_point.point
+        yield from key_point.sources
     for disagreement in result.disagreements:
-        texts.extend(
-            [
-                disagreement.topic,
-                disagreement.majority,
-                disagreement.minority,
-                disagreement.why_it_matters,
-            ]
-        )
+        yield disagreement.topic
+        yield disagreement.majority
+        yield disagreement.minority
+        yield disagreement.why_it_matters
     for guidance in result.ops_guidance:
-        texts.append(guidance.text)
-    return texts
+        yield guidance.text
 
 
 def _assert_consensus_single_sentence(consensus: str) -> None:
     """Ensure consensus is a single sentence."""
     if "\n" in consensus:
         raise ValueError("Consensus must be a single sentence without newlines.")
-    terminators = sum(consensus.count(ch) for ch in ".!?")
+    terminators = consensus.count(".") + consensus.count("!") + consensus.count("?")
     if terminators > 1:
         raise ValueError("Consensus must be a single sentence.")
 
 
+_REQUIRED_OPS_LEVELS = frozenset({"OK", "CAUTION", "AVOID"})
+
+
 def _assert_ops_guidance(result: CommitteeResult) -> None:
     """Ensure ops guidance is complete and valid."""
     if len(result.ops_guidance) != 3:
         raise ValueError("ops_guidance must contain exactly 3 items.")
-    levels = {guidance.level for guidance in result.ops_guidance}
-    level_values = {level.value for level in levels}
+    level_values = {guidance.level.value for guidance in result.ops_guidance}
+    if level_values == _REQUIRED_OPS_LEVELS:
+        return
     if "OK" not in level_values:
         raise ValueError("ops_guidance must include an OK level.")
     if "CAUTION" not in level_values:
         raise ValueError("ops_guidance must include a CAUTION level.")
     if "AVOID" not in level_values:
         raise ValueError("ops_guidance must include an AVOID level.")
-    if not level_values.issubset({"OK", "CAUTION", "AVOID"}):
+    if not level_values.issubset(_REQUIRED_OPS_LEVELS):
         raise ValueError("ops_guidance must only use OK/CAUTION/AVOID levels.")
 
 
@@ -164,24 +176,36 @@ def _assert_core_claims_limit(stances: Sequence[Stance]) -> None:
 
 def _assert_evidence_ids(stance: Stance) -> None:
     """Validate evidence IDs against allowed snapshot paths."""
+    if ALLOWED_EVIDENCE_IDS.issuperset(stance.evidence_ids):
+        return
     invalid = [item for item in stance.evidence_ids if item not in ALLOWED_EVIDENCE_IDS]
-    if invalid:
-        raise ValueError(f"Invalid evidence_ids: {invalid}")
+    raise ValueError(f"Invalid evidence_ids: {invalid}")
+
+
+def _allowed_ticker_tokens(watchlist: Sequence[str]) -> frozenset[str]:
+    """Known non-ticker tokens plus the (uppercased) snapshot watchlist."""
+    return ALLOWED_NON_TICKER_TOKENS.union(ticker.upper() for ticker in watchlist)
 
 
 def _assert_no_unknown_tickers(texts: Iterable[str], watchlist: Sequence[str]) -> None:
     """Block unknown ticker mentions not in watchlist."""
-    watchlist_set = {ticker.upper() for ticker in watchlist}
-    for text in texts:
-        for token in TICKER_PATTERN.findall(text):
-            if token in ALLOWED_NON_TICKER_TOKENS:
-                continue
-            if token not in watchlist_set:
-                raise ValueError(f"Ticker '{token}' not found in snapshot watchlist.")
+    _assert_no_unknown_tickers_in(_TEXT_SEPARATOR.join(texts), _allowed_ticker_tokens(watchlist))
+
+
+def _assert_no_unknown_tickers_in(joined: str, allowed: frozenset[str]) -> None:
+    """Block ticker-like tokens outside `allowed` in already-joined text; stops at the first one."""
+    if _TICKER_PROBE.search(joined) is None:
+        return
+    for match in TICKER_PATTERN.finditer(joined):
+        token = match.group(0)
+        if token not in allowed:
+            raise ValueError(f"Ticker '{token}' not found in snapshot watchlist.")
 
 
 def validate_snapshot(snapshot: Snapshot | dict) -> Snapshot:
-    """Validate snapshot schema."""
+    """Validate snapshot schema; an existing Snapshot instance is returned as-is."""
+    if isinstance(snapshot, Snapshot):
+        return snapshot
     try:
         return Snapshot.model_validate(snapshot)
     except ValidationError as exc:
@@ -190,14 +214,12 @@ def validate_snapshot(snapshot: Snapshot | dict) -> Snapshot:
 
 def validate_stances(stances: Iterable[Stance | dict]) -> List[Stance]:
     """Validate stance list schema and constraints."""
-    normalized: List[Stance] = []
-    for stance in stances:
-        try:
-            model = Stance.model_validate(stance)
-        except ValidationError as exc:
-            raise ValueError(str(exc)) from exc
+    try:
+        normalized = STANCE_LIST_ADAPTER.validate_python(list(stances))
+    except ValidationError as exc:
+        raise ValueError(str(exc)) from exc
+    for model in normalized:
         _assert_evidence_ids(model)
-        normalized.append(model)
     _assert_stances_present(normalized)
     _assert_core_claims_limit(normalized)
     return normalized
@@ -205,17 +227,22 @@ def validate_stances(stances: Iterable[Stance | dict]) -> List[Stance]:
 
 def validate_committee_result(result: CommitteeResult | dict) -> CommitteeResult:
     """Validate committee result schema and constraints."""
-    try:
-        model = CommitteeResult.model_validate(result)
-    except ValidationError as exc:
-        raise ValueError(str(exc)) from exc
+    if isinstance(result, CommitteeResult):
+        model = result
+    else:
+        try:
+            model = CommitteeResult.model_validate(result)
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
     _assert_consensus_single_sentence(model.consensus)
     _assert_ops_guidance(model)
     return model
 
 
 def validate_report(report: Report | dict) -> Report:
-    """Validate final report schema."""
+    """Validate final report schema; an existing Report instance is returned as-is."""
+    if isinstance(report, Report):
+        return report
     try:
         model = Report.model_validate(report)
     except ValidationError as exc:
@@ -231,11 +258,13 @@ def validate_pipeline(
 ) -> None:
     """Validate full pipeline outputs."""
     normalized_snapshot = validate_snapshot(snapshot)
+    allowed_tokens = _allowed_ticker_tokens(normalized_snapshot.watchlist)
     normalized_stances = validate_stances(stances)
     normalized_result = validate_committee_result(committee_result)
 
-    texts = _extract_text_fields(normalized_snapshot, normalized_stances, normalized_result)
-    _assert_no_forbidden_phrases(texts)
+    # Each text field is joined exactly once; the forbidden-phrase scan covers everything and the
+    # ticker scan reuses the generated part.
+    #
     # NOTE: Ticker validation is intended to prevent *generated* outputs from mentioning
     # unknown tickers not present in the snapshot watchlist.
     #
@@ -245,27 +274,12 @@ def validate_pipeline(
     # break the nightly pipeline, we only enforce the ticker whitelist on:
     # - agent/committee generated text
     # - snapshot summary notes (authored by our code)
-    ticker_guard_texts: List[str] = []
-    ticker_guard_texts.extend([normalized_snapshot.market_summary.note, normalized_snapshot.flow_summary.note])
-    for stance in normalized_stances:
-        ticker_guard_texts.extend(stance.core_claims)
-        ticker_guard_texts.append(stance.korean_comment)
-    ticker_guard_texts.append(normalized_result.consensus)
-    for key_point in normalized_result.key_points:
-        ticker_guard_texts.append(key_point.point)
-        ticker_guard_texts.extend(key_point.sources)
-    for disagreement in normalized_result.disagreements:
-        ticker_guard_texts.extend(
-            [
-                disagreement.topic,
-                disagreement.majority,
-                disagreement.minority,
-                disagreement.why_it_matters,
-            ]
-        )
-    for guidance in normalized_result.ops_guidance:
-        ticker_guard_texts.append(guidance.text)
-    _assert_no_unknown_tickers(ticker_guard_texts, normalized_snapshot.watchlist)
+    generated = _TEXT_SEPARATOR.join(
+        _iter_generated_text_fields(normalized_snapshot, normalized_stances, normalized_result)
+    )
+    external = _TEXT_SEPARATOR.join(chain(normalized_snapshot.sector_moves, normalized_snapshot.news_headlines))
+    _assert_no_forbidden_phrases_in(f"{external}{_TEXT_SEPARATOR}{generated}")
+    _assert_no_unknown_tickers_in(generated, allowed_tokens)
 
     if report is not None:
         validate_report(report)
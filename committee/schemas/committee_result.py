@@ -5,11 +5,10 @@ from __future__ import annotations
 from enum import Enum
 from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field, constr
+from pydantic import BaseModel, ConfigDict, Field
 
+from committee.schemas.text_types import SentenceText, ShortText
 
-ShortText = constr(strip_whitespace=True, min_length=1, max_length=200)
-SentenceText = constr(strip_whitespace=True, min_length=1, max_length=300)
 
 SourceNames = Annotated[list[ShortText], Field(min_length=1, max_length=5)]
 
@@ -19,8 +18,7 @@ class KeyPoint(BaseModel):
     point: ShortText
     sources: SourceNames
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 KeyPoints = Annotated[list[KeyPoint], Field(min_length=1, max_length=3)]
@@ -34,8 +32,7 @@ class Disagreement(BaseModel):
     minority_agents: Annotated[list[ShortText], Field(min_length=1, max_length=5)]
     why_it_matters: ShortText
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 Disagreements = Annotated[list[Disagreement], Field(min_length=1, max_length=3)]
@@ -53,8 +50,7 @@ class OpsGuidance(BaseModel):
     level: OpsGuidanceLevel
     text: ShortText
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 OpsGuidanceList = Annotated[list[OpsGuidance], Field(min_length=3, max_length=3)]
@@ -82,5 +78,4 @@ class CommitteeResult(BaseModel):
         ),
     )
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from pydantic import BaseModel, Field, constr
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from committee.schemas.stance import AgentName, IdToken, RegimeTag
 
 
-ShortText = constr(strip_whitespace=True, min_length=1, max_length=240)
+ShortText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=240)]
 
 
 EvidenceIds = Annotated[list[IdToken], Field(min_length=1, max_length=8)]
@@ -24,8 +24,7 @@ class DebateMinute(BaseModel):
     references: EvidenceIds
     internal_regime_tag: RegimeTag
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 DebateMinutes = Annotated[list[DebateMinute], Field(min_length=1, max_length=14)]
@@ -39,5 +38,4 @@ class DebateRound(BaseModel):
     minutes: DebateMinutes
     round_conclusion: ShortText
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
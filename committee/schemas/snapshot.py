@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field, constr
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
+from committee.schemas.text_types import MediumText, ShortText
 
-ShortText = constr(strip_whitespace=True, min_length=1, max_length=200)
-MediumText = constr(strip_whitespace=True, min_length=1, max_length=500)
-Ticker = constr(strip_whitespace=True, min_length=1, max_length=12)
+
+Ticker = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=12)]
 
 SectorMoves = Annotated[list[ShortText], Field(min_length=1, max_length=10)]
 NewsHeadlines = Annotated[list[ShortText], Field(min_length=1, max_length=10)]
@@ -22,8 +22,7 @@ class MarketSummary(BaseModel):
     kospi_change_pct: float
     usdkrw: float
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class FlowSummary(BaseModel):
@@ -33,8 +32,7 @@ class FlowSummary(BaseModel):
     institution_net: float
     retail_net: float
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class KoreanFlowInvestors(BaseModel):
@@ -44,8 +42,7 @@ class KoreanFlowInvestors(BaseModel):
     foreign: int
     institution: int
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class KoreanMarketFlow(BaseModel):
@@ -58,8 +55,7 @@ class KoreanMarketFlow(BaseModel):
     date: ShortText  # YYYY-MM-DD
     market: dict[str, KoreanFlowInvestors]
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 # --- Global markets: KR, US indices and FX (new top-level key, pipeline intact). ---
 
@@ -71,8 +67,7 @@ class MarketsKR(BaseModel):
     kospi_pct: float
     kosdaq_pct: float
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class MarketsUS(BaseModel):
@@ -84,8 +79,7 @@ class MarketsUS(BaseModel):
     nasdaq_pct: float
     dow_pct: float
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class MarketsFX(BaseModel):
@@ -93,16 +87,14 @@ class MarketsFX(BaseModel):
     usdkrw: float
     usdkrw_pct: float
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class MarketsVolatility(BaseModel):
     """Volatility metrics (best-effort)."""
     vix: float
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class Markets(BaseModel):
@@ -112,8 +104,7 @@ class Markets(BaseModel):
     fx: MarketsFX
     volatility: MarketsVolatility
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class MacroDaily(BaseModel):
@@ -135,8 +126,7 @@ class MacroDaily(BaseModel):
     russell2000: Optional[float] = None
     oil_brent: Optional[float] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class MacroMonthly(BaseModel):
@@ -156,8 +146,7 @@ class MacroMonthly(BaseModel):
     wage_yoy: Optional[float] = None
     export_yoy: Optional[float] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class MacroQuarterly(BaseModel):
@@ -165,8 +154,7 @@ class MacroQuarterly(BaseModel):
     real_gdp: Optional[float] = None
     gdp_qoq_annualized: Optional[float] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class MacroStructural(BaseModel):
@@ -183,8 +171,7 @@ class MacroStructural(BaseModel):
     tga_balance: Optional[float] = None
     boj_rate: Optional[float] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 # --- Macro data foundation (optional; snapshot.json remains backward compatible). ---
 
@@ -196,8 +183,7 @@ class Macro(BaseModel):
     quarterly: MacroQuarterly = Field(default_factory=MacroQuarterly)
     structural: MacroStructural = Field(default_factory=MacroStructural)
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class PhaseTwoSignals(BaseModel):
@@ -208,8 +194,7 @@ class PhaseTwoSignals(BaseModel):
     liquidity_signal_score: float = 0.0
     note: MediumText = "derived_from_existing_snapshot_inputs"
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class CumulativeContext(BaseModel):
@@ -226,8 +211,7 @@ class CumulativeContext(BaseModel):
     reversal_signal: bool = False
     note: MediumText = "rolling_context_unavailable"
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class Snapshot(BaseModel):
@@ -253,5 +237,4 @@ class Snapshot(BaseModel):
         description="Rolling context computed from recent runs for multi-day regime judgement.",
     )
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
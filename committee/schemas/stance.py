@@ -5,18 +5,22 @@ from __future__ import annotations
 from enum import Enum
 from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field, constr
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
 
+from committee.schemas.text_types import ShortText
 
-ShortText = constr(strip_whitespace=True, min_length=1, max_length=200)
-KoreanComment = constr(strip_whitespace=True, min_length=1, max_length=120)
-RawResponse = constr(strip_whitespace=False, min_length=1, max_length=4000)
-IdToken = constr(
-    strip_whitespace=True,
-    min_length=1,
-    max_length=60,
-    pattern=r"^snapshot\.[a-z0-9_]+(\.[a-z0-9_]+)*$",
-)
+
+KoreanComment = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=120)]
+RawResponse = Annotated[str, StringConstraints(strip_whitespace=False, min_length=1, max_length=4000)]
+IdToken = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        min_length=1,
+        max_length=60,
+        pattern=r"^snapshot\.[a-z0-9_]+(\.[a-z0-9_]+)*$",
+    ),
+]
 
 CoreClaims = Annotated[list[ShortText], Field(min_length=1, max_length=3)]
 EvidenceIds = Annotated[list[IdToken], Field(min_length=1, max_length=10)]
@@ -61,5 +65,8 @@ class Stance(BaseModel):
     evidence_ids: EvidenceIds = Field(..., description="Evidence ID list.")
     confidence: ConfidenceLevel = Field(..., description="Confidence level.")
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
+
+
+# Shared list codec: validates/serializes a whole stance list in one pydantic-core call.
+STANCE_LIST_ADAPTER = TypeAdapter(list[Stance])
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+# Shared constrained string types for committee schemas.
+
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+
+ShortText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)]
+SentenceText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=300)]
+MediumText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=500)]
@@ -10,21 +10,52 @@ Rules
 - If FRED_API_KEY is missing, log once and return None.
 """
 
+from datetime import date
+from itertools import islice
 import os
 import json
 from pathlib import Path
+import random
 import re
+import threading
 import time
+from typing import Iterable, Iterator
 
 import requests
 
+from committee.tools.http_session import CircuitOpenError, pooled_session, response_json
+
 
 FRED_BASE = "https://api.stlouisfed.org/fred/series/observations"
 _TRANSIENT_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
 _TRANSIENT_BACKOFF_SECS = (0.8, 1.6)
+# Cap on a server-provided Retry-After (429) so one throttled series cannot stall the snapshot.
+_MAX_RETRY_AFTER_SECS = 5.0
+# (connect, read): a dead connect fails fast while slow FRED responses still get 10s.
+_FRED_TIMEOUT_SECS = (3.05, 10)
+# Monthly/quarterly series cached within this window are served without an HTTP call. Daily and
+# weekly series (rates, spreads) always revalidate with If-Modified-Since so hourly runs stay current.
+_DEFAULT_FRESH_CACHE_SECS = 6 * 60 * 60
+# Observation spacing (days) from which a series counts as monthly or slower.
+_FRESH_CACHE_MIN_PERIOD_DAYS = 28
+_FRED_KEY_PATTERN = re.compile(r"[a-z0-9]{32}")
 _WARNED_NO_KEY = False
 _WARNED_BAD_KEY_FORMAT = False
 _WARNED_MISSING_SERIES: set[str] = set()
+# Snapshot fetches run FRED series concurrently; serialize the cache file read-modify-write.
+_CACHE_LOCK = threading.Lock()
+_SERIES_LOCKS: dict[str, threading.Lock] = {}
+_SERIES_LOCKS_GUARD = threading.Lock()
+# Per series: count of completed fetches, and the full value list the latest one obtained from FRED
+# or the fresh cache (None when it fell back). Callers queued behind a fetch reuse its values.
+_SERIES_FETCH_COUNTS: dict[str, int] = {}
+_SERIES_LAST_VALUES: dict[str, list[float] | None] = {}
+# The snapshot fans ~20 series out on 16 threads; keep at most this many FRED requests in flight
+# so a cold run stays under FRED's per-client rate limit (the rest queue on the same connections).
+_FRED_MAX_CONCURRENT_REQUESTS = 6
+_FRED_HTTP_SLOTS = threading.BoundedSemaphore(_FRED_MAX_CONCURRENT_REQUESTS)
+# One keep-alive session for every FRED series request (a snapshot fetches ~20 in a burst).
+_SESSION = pooled_session()
 
 
 def _fred_key() -> str | None:
@@ -33,7 +64,7 @@ def _fred_key() -> str | None:
         return None
     key = raw.strip().strip('"').strip("'").strip()
     global _WARNED_BAD_KEY_FORMAT  # noqa: PLW0603
-    if not _WARNED_BAD_KEY_FORMAT and not re.fullmatch(r"[a-z0-9]{32}", key):
+    if not _WARNED_BAD_KEY_FORMAT and not _FRED_KEY_PATTERN.fullmatch(key):
         _WARNED_BAD_KEY_FORMAT = True
         print("fred_api_key_suspicious_format (expected 32 lowercase alnum)")
     return key
@@ -85,47 +116,162 @@ def _save_cache(payload: dict) -> None:
         return
 
 
-def _read_cached_values(series_id: str, n: int) -> list[float] | None:
-    payload = _load_cache()
+def _fresh_cache_secs() -> float:
+    """Freshness window for the last-good cache (env: FRED_CACHE_FRESH_SECS, 0 disables)."""
+    raw = os.getenv("FRED_CACHE_FRESH_SECS", "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else float(_DEFAULT_FRESH_CACHE_SECS)
+    except ValueError:
+        return float(_DEFAULT_FRESH_CACHE_SECS)
+
+
+def _read_cached_record(series_id: str) -> dict | None:
+    with _CACHE_LOCK:
+        payload = _load_cache()
     series = payload.get("series")
     if not isinstance(series, dict):
         return None
     rec = series.get(series_id)
-    if not isinstance(rec, dict):
+    return rec if isinstance(rec, dict) else None
+
+
+def _read_cached_values(series_id: str, n: int) -> list[float] | None:
+    return _record_values(_read_cached_record(series_id), n)
+
+
+def _record_values(rec: dict | None, n: int, max_age_secs: float | None = None) -> list[float] | None:
+    if rec is None:
         return None
+    if max_age_secs is not None:
+        updated_at = rec.get("updated_at")
+        if not isinstance(updated_at, (int, float)) or time.time() - updated_at > max_age_secs:
+            return None
     vals = rec.get("values")
     if not isinstance(vals, list):
         return None
-    out: list[float] = []
-    for v in vals:
+    out = list(islice(_numeric_values(vals), n))
+    return out if len(out) >= n else None
+
+
+def _observation_period_days(observations: list) -> int | None:
+    """Days between the two most recent observation dates (the series cadence), if known."""
+    dates: list[date] = []
+    for item in observations:
         try:
-            out.append(float(v))
-        except Exception:
+            dates.append(date.fromisoformat(item.get("date")))
+        except (AttributeError, TypeError, ValueError):
+            continue
+        if len(dates) == 2:
+            return abs((dates[0] - dates[1]).days)
+    return None
+
+
+def _is_low_frequency(rec: dict | None) -> bool:
+    """True when a cached record belongs to a monthly-or-slower series."""
+    period_days = rec.get("period_days") if rec is not None else None
+    return isinstance(period_days, int) and period_days >= _FRESH_CACHE_MIN_PERIOD_DAYS
+
+
+def _numeric_values(raw_values: Iterable[object]) -> Iterator[float]:
+    """Yield raw values that parse as floats, skipping FRED's missing markers ("." / "")."""
+    for raw in raw_values:
+        if raw in (None, ".", ""):
+            continue
+        try:
+            yield float(raw)
+        except (TypeError, ValueError):
             continue
-        if len(out) >= n:
-            break
-    return out if len(out) >= n else None
 
 
-def _write_cached_values(series_id: str, values: list[float]) -> None:
+def _write_cached_values(
+    series_id: str,
+    values: list[float],
+    last_modified: str | None = None,
+    period_days: int | None = None,
+) -> None:
     if not values:
         return
-    payload = _load_cache()
-    series = payload.get("series")
-    if not isinstance(series, dict):
-        series = {}
-        payload["series"] = series
-    series[series_id] = {
-        "values": [float(v) for v in values[:240]],
-        "updated_at": int(time.time()),
-    }
-    _save_cache(payload)
+    with _CACHE_LOCK:
+        payload = _load_cache()
+        series = payload.get("series")
+        if not isinstance(series, dict):
+            series = {}
+            payload["series"] = series
+        record: dict = {
+            "values": [float(v) for v in values[:240]],
+            "updated_at": int(time.time()),
+        }
+        if last_modified:
+            record["last_modified"] = last_modified
+        if period_days is not None:
+            record["period_days"] = period_days
+        series[series_id] = record
+        _save_cache(payload)
+
+
+def _touch_cached_values(series_id: str) -> None:
+    """Mark a cached series as fresh again (the server confirmed it is unchanged)."""
+    with _CACHE_LOCK:
+        payload = _load_cache()
+        rec = (payload.get("series") or {}).get(series_id)
+        if not isinstance(rec, dict):
+            return
+        rec["updated_at"] = int(time.time())
+        _save_cache(payload)
+
+
+def _backoff_secs(attempt: int, retry_after: str | None = None) -> float:
+    """Delay before retry `attempt + 1`: a numeric Retry-After (capped) wins, else jittered backoff."""
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), _MAX_RETRY_AFTER_SECS)
+        except ValueError:
+            pass
+    base = _TRANSIENT_BACKOFF_SECS[attempt]
+    # Jitter spreads retries of series that failed together (same 504 burst) apart.
+    return base + random.uniform(0.0, base / 2)
 
 
 def fetch_fred_last_n_values(series_id: str, n: int) -> list[float] | None:
-    """Fetch last N numeric values for a FRED series (descending, with cache fallback)."""
+    """Fetch last N numeric values for a FRED series (descending, with cache fallback).
+
+    Concurrent callers for the same series (e.g. wage level and wage YoY) wait on one in-flight
+    request and reuse the values it fetched (at least max(2n, 24) observations), so the waiter
+    makes no round trip of its own unless it needs more values than the first caller got.
+    """
     if n < 1:
         return None
+    with _SERIES_LOCKS_GUARD:
+        lock = _SERIES_LOCKS.setdefault(series_id, threading.Lock())
+        seen = _SERIES_FETCH_COUNTS.get(series_id, 0)
+    with lock:
+        completed = _SERIES_FETCH_COUNTS.get(series_id, 0)
+        if completed != seen:
+            # A fetch finished while this caller waited on the lock; share its result.
+            shared = _SERIES_LAST_VALUES.get(series_id)
+            if shared is not None and len(shared) >= n:
+                return shared[:n]
+            if shared is None:
+                cached = _read_cached_values(series_id, n)
+                if cached:
+                    return cached
+        _SERIES_LAST_VALUES[series_id] = None
+        try:
+            return _fetch_fred_last_n_values_locked(series_id, n)
+        finally:
+            with _SERIES_LOCKS_GUARD:
+                _SERIES_FETCH_COUNTS[series_id] = completed + 1
+
+
+def _fetch_fred_last_n_values_locked(series_id: str, n: int) -> list[float] | None:
+    cached_record = _read_cached_record(series_id)
+    fresh_secs = _fresh_cache_secs()
+    if fresh_secs > 0 and _is_low_frequency(cached_record):
+        # Monthly/quarterly series rarely change between runs; skip the round trip when recent.
+        fresh = _record_values(cached_record, n, max_age_secs=fresh_secs)
+        if fresh:
+            _SERIES_LAST_VALUES[series_id] = list(_numeric_values(cached_record["values"]))
+            return fresh
     api_key = _fred_key()
     if not api_key:
         _warn_no_key_once()
@@ -134,28 +280,47 @@ def fetch_fred_last_n_values(series_id: str, n: int) -> list[float] | None:
             print(f"fred_cache_fallback[{series_id}]: no_api_key")
             return cached
         return None
+    # Revalidate a stale cached series with If-Modified-Since; a 304 reply carries no body.
+    last_modified = cached_record.get("last_modified") if cached_record is not None else None
+    revalidate_values = _record_values(cached_record, n) if isinstance(last_modified, str) else None
+    headers = {"If-Modified-Since": last_modified} if revalidate_values else None
     try:
         resp = None
-        for attempt in range(3):
-            resp = requests.get(
-                FRED_BASE,
-                params={
-                    "series_id": series_id,
-                    "api_key": api_key,
-                    "file_type": "json",
-                    "sort_order": "desc",
-                    "limit": max(int(n) * 2, 24),
-                },
-                timeout=10,
-            )
+        for attempt in range(len(_TRANSIENT_BACKOFF_SECS) + 1):
+            last_attempt = attempt == len(_TRANSIENT_BACKOFF_SECS)
+            try:
+                with _FRED_HTTP_SLOTS:
+                    resp = _SESSION.get(
+                        FRED_BASE,
+                        params={
+                            "series_id": series_id,
+                            "api_key": api_key,
+                            "file_type": "json",
+                            "sort_order": "desc",
+                            "limit": max(int(n) * 2, 24),
+                        },
+                        headers=headers,
+                        timeout=_FRED_TIMEOUT_SECS,
+                    )
+            except CircuitOpenError:
+                raise
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+                time.sleep(_backoff_secs(attempt))
+                continue
             if resp.status_code == 200:
                 break
-            if resp.status_code in _TRANSIENT_HTTP_STATUSES and attempt < 2:
-                time.sleep(_TRANSIENT_BACKOFF_SECS[attempt])
+            if resp.status_code == 304 and revalidate_values:
+                _touch_cached_values(series_id)
+                _SERIES_LAST_VALUES[series_id] = list(_numeric_values(cached_record["values"]))
+                return revalidate_values
+            if resp.status_code in _TRANSIENT_HTTP_STATUSES and not last_attempt:
+                time.sleep(_backoff_secs(attempt, resp.headers.get("Retry-After")))
                 continue
             msg = ""
             try:
-                payload_err = resp.json()
+                payload_err = response_json(resp)
                 msg = str(payload_err.get("error_message") or "").strip()
             except Exception:
                 msg = (resp.text or "").strip()
@@ -179,19 +344,14 @@ def fetch_fred_last_n_values(series_id: str, n: int) -> list[float] | None:
                 print(f"fred_cache_fallback[{series_id}]: bad_response")
                 return cached
             return None
-        payload = resp.json()
+        payload = response_json(resp)
         obs = payload.get("observations", [])
-        values: list[float] = []
-        for item in obs:
-            raw = item.get("value")
-            if raw in (None, ".", ""):
-                continue
-            try:
-                values.append(float(raw))
-            except Exception:
-                continue
+        values = list(_numeric_values(item.get("value") for item in obs))
         if values:
-            _write_cached_values(series_id, values)
+            _write_cached_values(
+                series_id, values, resp.headers.get("Last-Modified"), _observation_period_days(obs)
+            )
+            _SERIES_LAST_VALUES[series_id] = values
         if len(values) >= n:
             return values[:n]
         cached = _read_cached_values(series_id, n)
@@ -16,8 +16,15 @@ FRED provides stable, official macro time series (unemployment, CPI, PCE, PMI, w
 
 import re
 
-import requests
 from committee.tools.fred_common import fetch_fred_last_n_values
+from committee.tools.http_session import pooled_session
+
+
+_SESSION = pooled_session()
+_ISM_HEADERS = {"User-Agent": "DailyAIInvestmentCommittee/1.0"}
+# Headline "Manufacturing PMI® at 47.9%" (or similar), matched on the raw bytes to skip decoding.
+_ISM_PMI_HEADLINE_PATTERN = re.compile(rb"Manufacturing PMI[^0-9]{0,80}at\s+([0-9]{1,2}(?:\.[0-9])?)", re.IGNORECASE)
+_PMI_SOURCES_TRIED = ("ISM_WEB(go.weareism.org)",)
 
 
 def _fetch_last_n_values(series_id: str, n: int) -> list[float] | None:
@@ -113,9 +120,9 @@ def fetch_pmi() -> float | None:
     return value
 
 
-def pmi_series_ids_tried() -> list[str]:
-    """Return the list of sources attempted for PMI fetching."""
-    return ["ISM_WEB(go.weareism.org)"]
+def pmi_series_ids_tried() -> tuple[str, ...]:
+    """Return the sources attempted for PMI fetching (a shared immutable tuple)."""
+    return _PMI_SOURCES_TRIED
 
 
 def _fetch_ism_manufacturing_pmi() -> float | None:
@@ -125,17 +132,15 @@ def _fetch_ism_manufacturing_pmi() -> float | None:
     unavailable. This is best-effort scraping; on failure return None (caller stores NULL).
     """
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             "https://go.weareism.org/ism-manufacturing-pmi",
             timeout=10,
-            headers={"User-Agent": "DailyAIInvestmentCommittee/1.0"},
+            headers=_ISM_HEADERS,
         )
         if resp.status_code != 200:
             print(f"ism_pmi_http_error: {resp.status_code}")
             return None
-        text = resp.text or ""
-        # Look for the headline "Manufacturing PMI® at 47.9%" (or similar).
-        m = re.search(r"Manufacturing PMI[^0-9]{0,80}at\\s+([0-9]{1,2}(?:\\.[0-9])?)", text, re.IGNORECASE)
+        m = _ISM_PMI_HEADLINE_PATTERN.search(resp.content or b"")
         if not m:
             return None
         return float(m.group(1))
@@ -5,55 +5,46 @@ from __future__ import annotations
 # Failure handling: try/except around each fetch; on failure return (None, reason)
 # so snapshot builder can use fallback 0.0 and record reason in status.
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Tuple
-import requests
-
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+from committee.tools.http_session import pooled_session, response_json
 from committee.tools.news_digest import build_news_digest
 from committee.tools.providers import IDataProvider
 
 
+# Shared across calls so Yahoo/Naver/FX requests reuse kept-alive connections.
+_SESSION = pooled_session()
+# Common request headers; requests merges them into a fresh dict per call, so sharing is safe.
+_DEFAULT_HEADERS = {"User-Agent": "DailyAIInvestmentCommittee/1.0"}
+_NAVER_HEADERS = {"User-Agent": "Mozilla/5.0"}
+# Short-lived memo for fetches several getters repeat within one snapshot (Yahoo charts, the
+# USD/KRW spot rate). Values are shared read-only; failures (exceptions) are never cached.
+_MEMO_TTL_SECS = 60.0
+_MEMO_CACHE: dict[str, tuple[float, Any]] = {}
+_MEMO_LOCKS: dict[str, threading.Lock] = {}
+_MEMO_LOCKS_GUARD = threading.Lock()
+_USDKRW_SOURCES = (
+    ("er_api", "https://open.er-api.com/v6/latest/USD", ("rates", "KRW")),
+    ("exchangerate_host", "https://api.exchangerate.host/latest?base=USD&symbols=KRW", ("rates", "KRW")),
+    ("fawaz_api", "https://cdn.jsdelivr.net/npm/@fawazahmed0/currency-api@1/latest/currencies/usd/krw.json", ("krw",)),
+)
+
+
 class HttpProvider(IDataProvider):
     """Best-effort public data provider with internal error handling."""
 
     def get_usdkrw(self) -> Tuple[float | None, str | None]:
-        """Fetch USD/KRW using multiple public JSON endpoints."""
-        sources = [
-            ("er_api", "https://open.er-api.com/v6/latest/USD", ("rates", "KRW")),
-            ("exchangerate_host", "https://api.exchangerate.host/latest?base=USD&symbols=KRW", ("rates", "KRW")),
-            ("fawaz_api", "https://cdn.jsdelivr.net/npm/@fawazahmed0/currency-api@1/latest/currencies/usd/krw.json", ("krw",)),
-        ]
-
-        last_reason = "unavailable"
-        for name, url, path in sources:
-            try:
-                response = requests.get(url, timeout=7, headers=_default_headers())
-                if response.status_code != 200:
-                    last_reason = f"{name}:http_status_{response.status_code}"
-                    continue
-                try:
-                    payload = response.json()
-                except Exception:
-                    last_reason = f"{name}:json_parse_error"
-                    continue
-
-                value = _extract_json_value(payload, path)
-                if value is None:
-                    last_reason = f"{name}:key_missing"
-                    continue
-                try:
-                    return float(value), None
-                except Exception:
-                    last_reason = f"{name}:value_not_float"
-                    continue
-            except Exception as exc:
-                last_reason = f"{name}:{exc}"
-                continue
-
-        return None, last_reason
+        """Fetch USD/KRW by racing multiple public JSON endpoints; the first valid rate wins."""
+        try:
+            return _memoized("usdkrw", _race_usdkrw_sources), None
+        except RuntimeError as exc:
+            return None, str(exc)
 
     def get_kospi_change_pct(self) -> Tuple[float | None, str | None]:
         """Fetch KOSPI daily change % using Naver index API (Yahoo fallback)."""
@@ -76,7 +67,7 @@ class HttpProvider(IDataProvider):
                 return None, str(exc)
 
     # --- Global markets: KOSDAQ, US indices, USD/KRW pct (same fallback policy). ---
-    # Data source: Yahoo Finance chart API (interval=1d, range=2d) for daily pct.
+    # Data source: Yahoo Finance chart API meta (interval=1d, range=1d), falling back to 7d daily closes.
     # If fetch fails we return (None, reason); snapshot builder uses 0.0 and notes reason.
 
     def get_kosdaq_change_pct(self) -> Tuple[float | None, str | None]:
@@ -165,11 +156,11 @@ class HttpProvider(IDataProvider):
                     "https://cdn.jsdelivr.net/npm/@fawazahmed0/currency-api@1/"
                     f"{day}/currencies/usd/krw.json"
                 )
-                resp = requests.get(url, timeout=7, headers=_default_headers())
+                resp = _SESSION.get(url, timeout=7, headers=_DEFAULT_HEADERS)
                 if resp.status_code != 200:
                     last_reason = f"usdkrw_prev_http_{resp.status_code}"
                     continue
-                payload = resp.json()
+                payload = response_json(resp)
                 prev = _extract_json_value(payload, ("krw",))
                 if prev is None:
                     last_reason = "usdkrw_prev_key_missing"
@@ -232,23 +223,13 @@ class HttpProvider(IDataProvider):
         return titles[:limit], None
 
 
-def _default_headers() -> dict:
-    """Return common headers for HTTP requests."""
-    return {"User-Agent": "DailyAIInvestmentCommittee/1.0"}
-
-
 def _yahoo_daily_pct_chart(symbol: str) -> Tuple[float, None]:
-    """Compute daily pct change from Yahoo Finance chart (2d range).
+    """Compute daily pct change from Yahoo Finance chart meta (daily closes as fallback).
     Data source: query1.finance.yahoo.com v8/finance/chart. Raises on failure
     so caller can catch and return (None, reason); fallback 0.0 is applied by snapshot builder.
     """
-    intraday = requests.get(
-        f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1m&range=1d",
-        timeout=7,
-        headers=_default_headers(),
-    )
-    if intraday.status_code == 200:
-        payload = intraday.json()
+    payload = _yahoo_meta_payload(symbol)
+    if payload is not None:
         result = payload.get("chart", {}).get("result", [])
         if result:
             meta = result[0].get("meta", {}) or {}
@@ -261,19 +242,7 @@ def _yahoo_daily_pct_chart(symbol: str) -> Tuple[float, None]:
                     pct = ((regular_f - prev_f) / prev_f) * 100.0
                     return (pct, None)
 
-    response = requests.get(
-        f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=7d",
-        timeout=7,
-        headers=_default_headers(),
-    )
-    if response.status_code != 200:
-        raise RuntimeError(f"http_status_{response.status_code}")
-    payload = response.json()
-    result = payload.get("chart", {}).get("result", [])
-    if not result:
-        raise RuntimeError("no_result")
-    closes = result[0].get("indicators", {}).get("quote", [])[0].get("close", [])
-    closes = [v for v in closes if v is not None]
+    closes = _yahoo_closes(_yahoo_chart_payload(symbol, "1d", "7d"))
     if len(closes) < 2:
         raise RuntimeError("insufficient_closes")
     prev_close, latest_close = closes[-2], closes[-1]
@@ -283,13 +252,8 @@ def _yahoo_daily_pct_chart(symbol: str) -> Tuple[float, None]:
 
 def _yahoo_latest_level(symbol: str) -> Tuple[float, None]:
     """Fetch latest market level from Yahoo Finance chart endpoint."""
-    intraday = requests.get(
-        f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1m&range=1d",
-        timeout=7,
-        headers=_default_headers(),
-    )
-    if intraday.status_code == 200:
-        payload = intraday.json()
+    payload = _yahoo_meta_payload(symbol)
+    if payload is not None:
         result = payload.get("chart", {}).get("result", [])
         if result:
             meta = result[0].get("meta", {}) or {}
@@ -297,24 +261,66 @@ def _yahoo_latest_level(symbol: str) -> Tuple[float, None]:
             if regular is not None:
                 return float(regular), None
 
-    response = requests.get(
-        f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=7d",
-        timeout=7,
-        headers=_default_headers(),
-    )
-    if response.status_code != 200:
-        raise RuntimeError(f"http_status_{response.status_code}")
-    payload = response.json()
-    result = payload.get("chart", {}).get("result", [])
-    if not result:
-        raise RuntimeError("no_result")
-    closes = result[0].get("indicators", {}).get("quote", [])[0].get("close", [])
-    closes = [v for v in closes if v is not None]
+    closes = _yahoo_closes(_yahoo_chart_payload(symbol, "1d", "7d"))
     if not closes:
         raise RuntimeError("no_close_values")
     return float(closes[-1]), None
 
 
+def _yahoo_meta_payload(symbol: str) -> dict | None:
+    """Return a 1d/1d chart payload for its meta block, or None on a non-200 status.
+
+    Only meta.regularMarketPrice/chartPreviousClose are read, and meta is the same for any interval;
+    a daily bar keeps the body to one row instead of a full session of 1m OHLCV bars.
+    """
+    try:
+        return _yahoo_chart_payload(symbol, "1d", "1d")
+    except RuntimeError:
+        return None
+
+
+def _yahoo_chart_payload(symbol: str, interval: str, range_: str) -> dict:
+    """GET a Yahoo chart payload; the pct and level getters for one index share these URLs."""
+    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval={interval}&range={range_}"
+
+    def fetch() -> dict:
+        response = _SESSION.get(url, timeout=7, headers=_DEFAULT_HEADERS)
+        if response.status_code != 200:
+            raise RuntimeError(f"http_status_{response.status_code}")
+        return response_json(response)
+
+    return _memoized(url, fetch)
+
+
+def _memoized(key: str, fetch: Callable[[], Any]) -> Any:
+    """Return fetch() for key, reusing a result from the last _MEMO_TTL_SECS.
+
+    Getters run concurrently in the snapshot pool; callers for the same key wait on one in-flight
+    fetch instead of duplicating it.
+    """
+    with _MEMO_LOCKS_GUARD:
+        lock = _MEMO_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        cached = _MEMO_CACHE.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        value = fetch()
+        _MEMO_CACHE[key] = (time.monotonic() + _MEMO_TTL_SECS, value)
+        return value
+
+
+def _yahoo_closes(payload: dict) -> list[float]:
+    """Return non-null daily closes from a Yahoo chart payload; raise no_result when it has none."""
+    try:
+        result = payload["chart"]["result"]
+        if not result:
+            raise RuntimeError("no_result")
+        closes = result[0]["indicators"]["quote"][0].get("close") or []
+    except (KeyError, IndexError, TypeError) as exc:
+        raise RuntimeError("no_result") from exc
+    return [v for v in closes if v is not None]
+
+
 def _naver_index_daily_pct(index_code: str) -> Tuple[float, None]:
     """Compute daily pct change for KR indices from Naver mobile API.
 
@@ -326,11 +332,11 @@ def _naver_index_daily_pct(index_code: str) -> Tuple[float, None]:
         raise RuntimeError(f"unsupported_index_code[{code}]")
 
     url = f"https://m.stock.naver.com/api/index/{code}/price?pageSize=2&page=1"
-    response = requests.get(url, timeout=7, headers={"User-Agent": "Mozilla/5.0"})
+    response = _SESSION.get(url, timeout=7, headers=_NAVER_HEADERS)
     if response.status_code != 200:
         raise RuntimeError(f"naver_http_status_{response.status_code}")
     try:
-        payload = response.json()
+        payload = response_json(response)
     except Exception as exc:
         raise RuntimeError(f"naver_json_parse_error: {exc}") from exc
     if not isinstance(payload, list) or not payload:
@@ -364,10 +370,10 @@ def _naver_index_close(index_code: str) -> Tuple[float, None]:
         raise RuntimeError(f"unsupported_index_code[{code}]")
 
     url = f"https://m.stock.naver.com/api/index/{code}/price?pageSize=1&page=1"
-    response = requests.get(url, timeout=7, headers={"User-Agent": "Mozilla/5.0"})
+    response = _SESSION.get(url, timeout=7, headers=_NAVER_HEADERS)
     if response.status_code != 200:
         raise RuntimeError(f"naver_http_status_{response.status_code}")
-    payload = response.json()
+    payload = response_json(response)
     if not isinstance(payload, list) or not payload:
         raise RuntimeError("naver_empty_payload")
     latest = payload[0] or {}
@@ -377,6 +383,45 @@ def _naver_index_close(index_code: str) -> Tuple[float, None]:
     return float(close_raw), None
 
 
+def _race_usdkrw_sources() -> float:
+    """Return the first valid USD/KRW rate; raise RuntimeError with every source's reason when all fail."""
+    reasons: list[str] = []
+    # No `with` block: its shutdown would wait for the slower sources we no longer need.
+    pool = ThreadPoolExecutor(max_workers=len(_USDKRW_SOURCES), thread_name_prefix="usdkrw")
+    try:
+        futures = [pool.submit(_fetch_usdkrw_source, name, url, path) for name, url, path in _USDKRW_SOURCES]
+        for future in as_completed(futures):
+            value, reason = future.result()
+            if value is not None:
+                return value
+            reasons.append(reason or "unavailable")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    raise RuntimeError("; ".join(reasons) or "unavailable")
+
+
+def _fetch_usdkrw_source(name: str, url: str, path: tuple) -> Tuple[float | None, str | None]:
+    """Fetch USD/KRW from one source; the JSON shapes differ, so each carries its own key path."""
+    try:
+        response = _SESSION.get(url, timeout=7, headers=_DEFAULT_HEADERS)
+        if response.status_code != 200:
+            return None, f"{name}:http_status_{response.status_code}"
+        try:
+            payload = response_json(response)
+        except Exception:
+            return None, f"{name}:json_parse_error"
+
+        value = _extract_json_value(payload, path)
+        if value is None:
+            return None, f"{name}:key_missing"
+        try:
+            return float(value), None
+        except Exception:
+            return None, f"{name}:value_not_float"
+    except Exception as exc:
+        return None, f"{name}:{exc}"
+
+
 def _extract_json_value(payload: dict, path: tuple) -> float | None:
     """Extract nested value by path from JSON payload."""
     current = payload
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+# Pooled requests.Session factory for provider modules.
+# A module-level Session keeps TCP/TLS connections alive between calls to the same host,
+# so repeated fetches (FRED series, Yahoo charts, Naver indices) skip the handshake.
+
+import json
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json.
+    orjson = None
+
+
+# Snapshot builds fan fetches out on up to 16 threads; size the per-host pool to match so
+# concurrent calls reuse connections instead of opening throwaway ones.
+_POOL_CONNECTIONS = 8
+_POOL_MAXSIZE = 16
+# After this many consecutive connection failures/timeouts, calls to the host fail fast for
+# _CIRCUIT_OPEN_SECS instead of each paying the full timeout (matters for backfill loops).
+_CIRCUIT_FAILURE_THRESHOLD = 3
+_CIRCUIT_OPEN_SECS = 300.0
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without touching the network while a host's circuit is open."""
+
+
+class _CircuitBreakerAdapter(HTTPAdapter):
+    """HTTPAdapter that short-circuits hosts which keep failing to connect.
+
+    Only connection failures (including ConnectTimeout) count toward the trip. A ReadTimeout means
+    the host answered the connect but one request was slow, so it must not lock out other series.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._circuit_lock = threading.Lock()
+        # host -> (consecutive failures, monotonic time until which the circuit stays open)
+        self._circuit_state: dict[str, tuple[int, float]] = {}
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        host = urlsplit(request.url).netloc
+        with self._circuit_lock:
+            _, open_until = self._circuit_state.get(host, (0, 0.0))
+        if open_until > time.monotonic():
+            raise CircuitOpenError(f"circuit_open[{host}]", request=request)
+        try:
+            response = super().send(request, **kwargs)
+        except requests.ConnectionError:
+            self._record_failure(host)
+            raise
+        with self._circuit_lock:
+            self._circuit_state.pop(host, None)
+        return response
+
+    def _record_failure(self, host: str) -> None:
+        with self._circuit_lock:
+            failures, open_until = self._circuit_state.get(host, (0, 0.0))
+            failures += 1
+            if failures >= _CIRCUIT_FAILURE_THRESHOLD:
+                open_until = time.monotonic() + _CIRCUIT_OPEN_SECS
+            self._circuit_state[host] = (failures, open_until)
+
+
+def pooled_session() -> requests.Session:
+    """Return a new Session whose http(s) adapters keep up to _POOL_MAXSIZE connections per host.
+
+    The adapters also trip a per-host circuit breaker (see CircuitOpenError) on repeated connect failures.
+    """
+    session = requests.Session()
+    adapter = _CircuitBreakerAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body straight from bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
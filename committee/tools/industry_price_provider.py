@@ -95,6 +95,8 @@ class YahooChartPriceProvider(IndustryPriceProvider):
     ) -> List[AssetPriceRecord]:
         import requests  # local import: keep this module import-safe without requests at load time
 
+        from committee.tools.http_session import response_json
+
         start_d = date.fromisoformat(str(start))
         end_d = date.fromisoformat(str(end))
         if end_d < start_d:
@@ -123,7 +125,8 @@ class YahooChartPriceProvider(IndustryPriceProvider):
             raise PriceFetchError(f"http_status_{response.status_code}[{symbol}]")
 
         try:
-            payload = response.json()
+            # Multi-year OHLC arrays are number-heavy; response_json decodes them with orjson when present.
+            payload = response_json(response)
         except Exception as exc:  # noqa: BLE001
             raise PriceFetchError(f"invalid_json[{symbol}]: {exc}") from exc
 
@@ -12,9 +12,20 @@ Rules (per spec)
 - Never return 0.0 placeholders from providers.
 """
 
+import threading
+import time
+
 from committee.tools.fred_common import fetch_fred_latest
 
 
+# Several fetchers share Yahoo symbols within one snapshot (^VIX, ^VIX3M, BZ=F); memoize closes
+# briefly so a build fetches each symbol once. Failures (None) are never cached.
+_CLOSE_TTL_SECS = 60.0
+_CLOSE_CACHE: dict[str, tuple[float, float]] = {}
+_CLOSE_LOCKS: dict[str, threading.Lock] = {}
+_CLOSE_LOCKS_GUARD = threading.Lock()
+
+
 def _import_yfinance():
     try:
         import yfinance as yf  # type: ignore
@@ -25,6 +36,23 @@ def _import_yfinance():
 
 
 def _fetch_latest_close(symbol: str) -> float | None:
+    """Fetch latest Close for a Yahoo symbol, reusing a result from the last _CLOSE_TTL_SECS.
+
+    Concurrent callers for the same symbol wait on one in-flight fetch instead of duplicating it.
+    """
+    with _CLOSE_LOCKS_GUARD:
+        lock = _CLOSE_LOCKS.setdefault(symbol, threading.Lock())
+    with lock:
+        cached = _CLOSE_CACHE.get(symbol)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        value = _fetch_latest_close_uncached(symbol)
+        if value is not None:
+            _CLOSE_CACHE[symbol] = (time.monotonic() + _CLOSE_TTL_SECS, value)
+        return value
+
+
+def _fetch_latest_close_uncached(symbol: str) -> float | None:
     """Fetch latest Close for a Yahoo symbol via yfinance."""
     yf = _import_yfinance()
     if yf is None:
@@ -12,19 +12,22 @@ import xml.etree.ElementTree as ET
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from io import BytesIO
 from math import log1p
 from typing import Dict, List, Tuple
 from urllib.parse import parse_qsl, quote, urlencode, urlparse, urlunparse
 
-import requests
+from committee.tools.http_session import pooled_session
 
 
-def _default_headers() -> dict[str, str]:
-    """Return common headers for HTTP requests."""
-    return {
-        "User-Agent": "DailyAIInvestmentCommittee/1.0",
-        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-    }
+# RSS and article fetches repeat against the same hosts (news.google.com redirects), so keep
+# connections alive across calls.
+_SESSION = pooled_session()
+# Common request headers; requests merges them into a fresh dict per call, so sharing is safe.
+_DEFAULT_HEADERS = {
+    "User-Agent": "DailyAIInvestmentCommittee/1.0",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
 
 
 @dataclass(frozen=True)
@@ -148,19 +151,30 @@ def fetch_google_news_items(
     """
     q = quote(query)
     url = f"https://news.google.com/rss/search?q={q}"
-    response = requests.get(url, timeout=timeout, headers=_default_headers())
+    response = _SESSION.get(url, timeout=timeout, headers=_DEFAULT_HEADERS)
     if response.status_code != 200:
         raise RuntimeError(f"http_status_{response.status_code}")
 
-    root = ET.fromstring(response.text)
+    return _parse_rss_items(response.content, limit)
+
+
+def _parse_rss_items(xml_bytes: bytes, limit: int) -> List[tuple[str, str, datetime | None]]:
+    """Stream RSS <item> elements, stopping once ``limit`` titled items are collected.
+
+    Parsing the raw bytes lets the XML declaration pick the encoding, and each finished item is
+    cleared so long feeds are never held in memory as a full tree.
+    """
     items: List[tuple[str, str, datetime | None]] = []
-    for item in root.findall(".//item"):
+    for _event, item in ET.iterparse(BytesIO(xml_bytes), events=("end",)):
+        if item.tag != "item":
+            continue
         title_el = item.find("title")
         link_el = item.find("link")
         pub_date_el = item.find("pubDate")
         title = (title_el.text or "").strip() if title_el is not None else ""
         link = (link_el.text or "").strip() if link_el is not None else ""
         pub_date_raw = (pub_date_el.text or "").strip() if pub_date_el is not None else ""
+        item.clear()
         published_at = _parse_rss_pub_date(pub_date_raw)
         if title:
             items.append((title, link, published_at))
@@ -314,7 +328,7 @@ def summarize_article(link: str, timeout: int = 7, title: str | None = None) ->
     if not link:
         return ["기사 링크가 없습니다.", "본문 수집 실패.", "RSS 제목만 참고하세요."]
     try:
-        response = requests.get(link, timeout=timeout, headers=_default_headers(), allow_redirects=True)
+        response = _SESSION.get(link, timeout=timeout, headers=_DEFAULT_HEADERS, allow_redirects=True)
         if response.status_code != 200:
             return _fallback_summary_from_title(title)
         plain = _strip_html_to_text(response.text)
@@ -463,7 +463,7 @@ def main() -> None:
                             "DB 기반 재구성 실패 시 강행하지 않습니다."
                         )
                     snapshot = build_snapshot(d)
-                    status = get_last_snapshot_status() or {}
+                    status = dict(get_last_snapshot_status())
                     persist_snapshot_metrics(snapshot=snapshot, market_date=d, status=status)
                 else:
                     status = {"rebuild_source": "db_history"}
@@ -0,0 +1,67 @@
+"""Shared Snapshot/Stance/CommitteeResult builders for the report and storage tests."""
+
+from __future__ import annotations
+
+from committee.schemas.committee_result import CommitteeResult
+from committee.schemas.snapshot import Snapshot
+from committee.schemas.stance import Stance
+
+
+def make_snapshot(with_macro: bool = True) -> Snapshot:
+    payload = {
+        "market_summary": {"note": "KOSPI -0.13%, USD/KRW 1423.62.", "kospi_change_pct": -0.13, "usdkrw": 1423.62},
+        "flow_summary": {"note": "외국인 +1909억", "foreign_net": 1909.0, "institution_net": 786.0, "retail_net": -2401.0},
+        "sector_moves": ["n/a"],
+        "news_headlines": ["headline"],
+        "watchlist": ["SPY", "QQQ", "XLK"],
+        "markets": {
+            "kr": {"kospi_pct": -0.13, "kosdaq_pct": -0.99},
+            "us": {"sp500_pct": -0.18, "nasdaq_pct": -0.06, "dow_pct": -0.85},
+            "fx": {"usdkrw": 1423.62, "usdkrw_pct": -0.12},
+            "volatility": {"vix": 15.08},
+        },
+    }
+    if with_macro:
+        payload["macro"] = {
+            "daily": {"us10y": 4.67, "us2y": 3.73, "spread_2_10": 0.94, "dxy": 99.98},
+            "monthly": {"unemployment_rate": 4.2, "cpi_yoy": 3.73},
+            "structural": {"fed_funds_rate": 3.63, "real_rate": 2.41},
+        }
+    return Snapshot.model_validate(payload)
+
+
+def make_stance(agent: str, tag: str, raw_response: str | None = None) -> Stance:
+    return Stance.model_validate(
+        {
+            "agent_name": agent,
+            "core_claims": ["Macro tone is balanced.", "No major shocks."],
+            "korean_comment": "거시는 균형적입니다.",
+            "raw_response": raw_response,
+            "regime_tag": tag,
+            "evidence_ids": ["snapshot.market_summary.note"],
+            "confidence": "MED",
+        }
+    )
+
+
+def make_committee_result() -> CommitteeResult:
+    return CommitteeResult.model_validate(
+        {
+            "consensus": "Committee maintains a neutral posture with selective positioning.",
+            "key_points": [{"point": "Majority regime tag: NEUTRAL.", "sources": ["macro", "risk"]}],
+            "disagreements": [
+                {
+                    "topic": "Regime tags",
+                    "majority": "NEUTRAL",
+                    "minority": "RISK_ON",
+                    "minority_agents": ["flow"],
+                    "why_it_matters": "Minority risk regime can change positioning boundaries.",
+                }
+            ],
+            "ops_guidance": [
+                {"level": "OK", "text": "Maintain balanced exposure."},
+                {"level": "CAUTION", "text": "Keep risk limits tight."},
+                {"level": "AVOID", "text": "Avoid aggressive leverage."},
+            ],
+        }
+    )
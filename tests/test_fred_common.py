@@ -0,0 +1,234 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.tools import fred_common
+
+
+class _Response:
+    def __init__(
+        self,
+        values: list[str],
+        status_code: int = 200,
+        headers: dict | None = None,
+        period_days: int = 30,
+    ) -> None:
+        self._values = values
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+        self._period_days = period_days
+
+    @property
+    def content(self) -> bytes:
+        # Newest first, like FRED's sort_order=desc.
+        latest = date(2026, 9, 30)
+        observations = [
+            {"date": (latest - timedelta(days=i * self._period_days)).isoformat(), "value": value}
+            for i, value in enumerate(self._values)
+        ]
+        return json.dumps({"observations": observations}).encode()
+
+
+class FredLastGoodCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self._tmp.name) / "fred_cache.json"
+        self._env = mock.patch.dict(
+            "os.environ",
+            {"FRED_CACHE_PATH": str(self.cache_path), "FRED_API_KEY": "a" * 32},
+        )
+        self._env.start()
+
+    def tearDown(self) -> None:
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def _seed(self, values: list[float], updated_at: float, series_id: str = "CPIAUCSL", period_days: int = 31) -> None:
+        record = {"values": values, "updated_at": updated_at, "period_days": period_days}
+        self.cache_path.write_text(json.dumps({"series": {series_id: record}}), encoding="utf-8")
+
+    def test_fresh_cache_skips_http(self) -> None:
+        self._seed([310.0, 309.0], time.time() - 60)
+        with mock.patch.object(fred_common._SESSION, "get") as get:
+            values = fred_common.fetch_fred_last_n_values("CPIAUCSL", 2)
+        self.assertEqual(values, [310.0, 309.0])
+        get.assert_not_called()
+
+    def test_fresh_daily_series_is_still_revalidated(self) -> None:
+        self._seed([4.1], time.time() - 60, series_id="DGS2", period_days=1)
+        with mock.patch.object(fred_common._SESSION, "get", return_value=_Response(["4.2"], period_days=1)) as get:
+            self.assertEqual(fred_common.fetch_fred_latest("DGS2"), 4.2)
+        get.assert_called_once()
+
+    def test_refetch_records_series_cadence(self) -> None:
+        with mock.patch.object(fred_common._SESSION, "get", return_value=_Response(["4.2", "4.1"], period_days=3)):
+            fred_common.fetch_fred_latest("DGS2")
+        cached = json.loads(self.cache_path.read_text(encoding="utf-8"))["series"]["DGS2"]
+        self.assertEqual(cached["period_days"], 3)
+        self.assertFalse(fred_common._is_low_frequency(cached))
+
+    def test_stale_cache_refetches_and_rewrites(self) -> None:
+        self._seed([300.0, 299.0], time.time() - 7 * 24 * 3600)
+        with mock.patch.object(fred_common._SESSION, "get", return_value=_Response(["311.5", ".", "310.0"])) as get:
+            values = fred_common.fetch_fred_last_n_values("CPIAUCSL", 2)
+        self.assertEqual(values, [311.5, 310.0])
+        get.assert_called_once()
+        cached = json.loads(self.cache_path.read_text(encoding="utf-8"))["series"]["CPIAUCSL"]
+        self.assertEqual(cached["values"], [311.5, 310.0])
+
+    def test_fresh_window_can_be_disabled(self) -> None:
+        self._seed([310.0, 309.0], time.time())
+        with mock.patch.dict("os.environ", {"FRED_CACHE_FRESH_SECS": "0"}):
+            with mock.patch.object(fred_common._SESSION, "get", return_value=_Response(["312.0", "311.0"])) as get:
+                values = fred_common.fetch_fred_last_n_values("CPIAUCSL", 2)
+        self.assertEqual(values, [312.0, 311.0])
+        get.assert_called_once()
+
+    def test_stale_cache_is_revalidated_with_last_modified(self) -> None:
+        last_modified = "Tue, 14 Oct 2026 13:30:00 GMT"
+        first = _Response(["311.5", "310.0"], headers={"Last-Modified": last_modified})
+        with mock.patch.dict("os.environ", {"FRED_CACHE_FRESH_SECS": "0"}):
+            with mock.patch.object(fred_common._SESSION, "get", return_value=first) as get:
+                fred_common.fetch_fred_last_n_values("CPIAUCSL", 2)
+            self.assertIsNone(get.call_args.kwargs["headers"])
+
+            with mock.patch.object(fred_common._SESSION, "get", return_value=_Response([], status_code=304)) as get:
+                values = fred_common.fetch_fred_last_n_values("CPIAUCSL", 2)
+        self.assertEqual(values, [311.5, 310.0])
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-Modified-Since": last_modified})
+        cached = json.loads(self.cache_path.read_text(encoding="utf-8"))["series"]["CPIAUCSL"]
+        self.assertEqual(cached["last_modified"], last_modified)
+
+    def test_concurrent_calls_for_one_series_share_a_request(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return _Response([str(300 + i) for i in range(24, 0, -1)])
+
+        with mock.patch.object(fred_common._SESSION, "get", side_effect=slow_get) as get:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                latest = pool.submit(fred_common.fetch_fred_last_n_values, "CES0500000003", 1)
+                self.assertTrue(started.wait(5))
+                history = pool.submit(fred_common.fetch_fred_last_n_values, "CES0500000003", 13)
+                release.set()
+                self.assertEqual(latest.result(5), [324.0])
+                self.assertEqual(len(history.result(5)), 13)
+        get.assert_called_once()
+
+    def test_waiter_reuses_in_flight_daily_result_without_revalidating(self) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        last_modified = "Tue, 14 Oct 2026 13:30:00 GMT"
+
+        def slow_get(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return _Response(
+                [str(4.0 + i / 100) for i in range(24)], headers={"Last-Modified": last_modified}, period_days=1
+            )
+
+        with mock.patch.dict("os.environ", {"FRED_CACHE_FRESH_SECS": "0"}):
+            with mock.patch.object(fred_common._SESSION, "get", side_effect=slow_get) as get:
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    first = pool.submit(fred_common.fetch_fred_last_n_values, "DGS10", 1)
+                    self.assertTrue(started.wait(5))
+                    second = pool.submit(fred_common.fetch_fred_last_n_values, "DGS10", 5)
+                    time.sleep(0.05)
+                    release.set()
+                    self.assertEqual(first.result(5), [4.0])
+                    self.assertEqual(second.result(5), [4.0, 4.01, 4.02, 4.03, 4.04])
+        get.assert_called_once()
+
+    def test_in_flight_requests_are_capped(self) -> None:
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+
+        def tracking_get(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return _Response(["1.0"])
+
+        series_ids = [f"SERIES{i}" for i in range(12)]
+        with mock.patch.dict("os.environ", {"FRED_CACHE_FRESH_SECS": "0"}):
+            with mock.patch.object(fred_common._SESSION, "get", side_effect=tracking_get):
+                with ThreadPoolExecutor(max_workers=12) as pool:
+                    results = list(pool.map(fred_common.fetch_fred_latest, series_ids))
+        self.assertEqual(results, [1.0] * 12)
+        self.assertLessEqual(in_flight[1], fred_common._FRED_MAX_CONCURRENT_REQUESTS)
+
+
+class FredRetryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = mock.patch.dict(
+            "os.environ",
+            {
+                "FRED_CACHE_PATH": str(Path(self._tmp.name) / "fred_cache.json"),
+                "FRED_API_KEY": "a" * 32,
+                "FRED_CACHE_FRESH_SECS": "0",
+            },
+        )
+        self._env.start()
+
+    def tearDown(self) -> None:
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def test_transient_status_and_connection_error_are_retried(self) -> None:
+        responses = [
+            _Response([], status_code=503),
+            fred_common.requests.ConnectionError("reset"),
+            _Response(["4.33"]),
+        ]
+        with mock.patch.object(fred_common._SESSION, "get", side_effect=responses) as get, mock.patch.object(
+            fred_common.time, "sleep"
+        ) as sleep:
+            self.assertEqual(fred_common.fetch_fred_latest("FEDFUNDS"), 4.33)
+        self.assertEqual(get.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(get.call_args.kwargs["timeout"], fred_common._FRED_TIMEOUT_SECS)
+
+    def test_retry_after_is_honoured_and_capped(self) -> None:
+        self.assertEqual(fred_common._backoff_secs(0, "2"), 2.0)
+        self.assertEqual(fred_common._backoff_secs(0, "120"), fred_common._MAX_RETRY_AFTER_SECS)
+        delay = fred_common._backoff_secs(1, "Wed, 21 Oct 2026 07:28:00 GMT")
+        self.assertGreaterEqual(delay, 1.6)
+        self.assertLessEqual(delay, 2.4)
+
+    def test_gives_up_after_last_attempt(self) -> None:
+        with mock.patch.object(
+            fred_common._SESSION, "get", side_effect=fred_common.requests.Timeout("slow")
+        ) as get, mock.patch.object(fred_common.time, "sleep"):
+            self.assertIsNone(fred_common.fetch_fred_latest("FEDFUNDS"))
+        self.assertEqual(get.call_count, 3)
+
+    def test_open_circuit_is_not_retried(self) -> None:
+        with mock.patch.object(
+            fred_common._SESSION, "get", side_effect=fred_common.CircuitOpenError("circuit_open")
+        ) as get, mock.patch.object(fred_common.time, "sleep") as sleep:
+            self.assertIsNone(fred_common.fetch_fred_latest("FEDFUNDS"))
+        self.assertEqual(get.call_count, 1)
+        sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
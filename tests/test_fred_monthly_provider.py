@@ -0,0 +1,29 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.tools import fred_monthly_provider
+
+
+def _page(html: str) -> mock.Mock:
+    return mock.Mock(status_code=200, content=html.encode("utf-8"))
+
+
+class IsmPmiScrapeTest(unittest.TestCase):
+    def test_parses_headline_across_whitespace(self) -> None:
+        html = "<h2>Manufacturing PMI® at\n  48.7%;</h2>"
+        with mock.patch.object(fred_monthly_provider._SESSION, "get", return_value=_page(html)):
+            self.assertEqual(fred_monthly_provider._fetch_ism_manufacturing_pmi(), 48.7)
+
+    def test_missing_headline_returns_none(self) -> None:
+        with mock.patch.object(fred_monthly_provider._SESSION, "get", return_value=_page("<p>no report</p>")):
+            self.assertIsNone(fred_monthly_provider._fetch_ism_manufacturing_pmi())
+
+
+if __name__ == "__main__":
+    unittest.main()
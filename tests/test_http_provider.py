@@ -0,0 +1,107 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.tools import http_provider
+
+
+class ModuleSessionTest(unittest.TestCase):
+    def test_provider_calls_go_through_module_session(self) -> None:
+        response = mock.Mock(status_code=200, content='[{"closePrice": "2,650.10"}]'.encode())
+        with mock.patch.object(http_provider._SESSION, "get", return_value=response) as get:
+            self.assertEqual(http_provider._naver_index_close("KOSPI"), (2650.1, None))
+            self.assertEqual(http_provider._naver_index_close("KOSPI"), (2650.1, None))
+        self.assertEqual(get.call_count, 2)
+
+
+class UsdKrwRaceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        http_provider._MEMO_CACHE.clear()
+        self.addCleanup(http_provider._MEMO_CACHE.clear)
+
+    def test_first_valid_source_wins(self) -> None:
+        def fake_get(url, **kwargs):
+            if "er-api" in url:
+                return mock.Mock(status_code=503)
+            if "exchangerate.host" in url:
+                return mock.Mock(status_code=200, content=b'{"rates": {}}')
+            return mock.Mock(status_code=200, content=b'{"krw": 1385.5}')
+
+        with mock.patch.object(http_provider._SESSION, "get", side_effect=fake_get) as get:
+            self.assertEqual(http_provider.HttpProvider().get_usdkrw(), (1385.5, None))
+        self.assertEqual(get.call_count, 3)
+
+    def test_all_sources_failing_reports_a_reason(self) -> None:
+        with mock.patch.object(http_provider._SESSION, "get", return_value=mock.Mock(status_code=500)):
+            value, reason = http_provider.HttpProvider().get_usdkrw()
+        self.assertIsNone(value)
+        self.assertEqual(
+            sorted(reason.split("; ")),
+            ["er_api:http_status_500", "exchangerate_host:http_status_500", "fawaz_api:http_status_500"],
+        )
+
+    def test_rate_is_reused_by_pct_fallback(self) -> None:
+        def fake_get(url, **kwargs):
+            if "finance.yahoo.com" in url:
+                return mock.Mock(status_code=404)
+            if url.endswith("/latest/USD"):
+                return mock.Mock(status_code=200, content=b'{"rates": {"KRW": 1400.0}}')
+            if "/latest/" in url:
+                return mock.Mock(status_code=503)
+            return mock.Mock(status_code=200, content=b'{"krw": 1386.0}')
+
+        provider = http_provider.HttpProvider()
+        with mock.patch.object(http_provider._SESSION, "get", side_effect=fake_get) as get:
+            self.assertEqual(provider.get_usdkrw(), (1400.0, None))
+            pct, reason = provider.get_usdkrw_pct()
+        self.assertIsNone(reason)
+        self.assertAlmostEqual(pct, (1400.0 - 1386.0) / 1386.0 * 100.0)
+        fx_calls = [c for c in get.call_args_list if "/latest" in c.args[0]]
+        self.assertEqual(len(fx_calls), 3)
+
+
+class YahooChartMemoTest(unittest.TestCase):
+    def setUp(self) -> None:
+        http_provider._MEMO_CACHE.clear()
+        self.addCleanup(http_provider._MEMO_CACHE.clear)
+
+    def test_pct_and_level_share_one_meta_request(self) -> None:
+        payload = {"chart": {"result": [{"meta": {"regularMarketPrice": 5050.0, "chartPreviousClose": 5000.0}}]}}
+        response = mock.Mock(status_code=200, content=http_provider.json.dumps(payload).encode())
+        with mock.patch.object(http_provider._SESSION, "get", return_value=response) as get:
+            self.assertEqual(http_provider._yahoo_daily_pct_chart("%5EGSPC"), (1.0, None))
+            self.assertEqual(http_provider._yahoo_latest_level("%5EGSPC"), (5050.0, None))
+        self.assertEqual(get.call_count, 1)
+
+    def test_failed_meta_fetch_falls_back_to_daily_closes_and_is_not_cached(self) -> None:
+        daily = {"chart": {"result": [{"indicators": {"quote": [{"close": [5000.0, 5100.0]}]}}]}}
+
+        def fake_get(url, **kwargs):
+            if "range=1d" in url:
+                return mock.Mock(status_code=429)
+            return mock.Mock(status_code=200, content=http_provider.json.dumps(daily).encode())
+
+        with mock.patch.object(http_provider._SESSION, "get", side_effect=fake_get) as get:
+            self.assertEqual(http_provider._yahoo_daily_pct_chart("%5EGSPC"), (2.0, None))
+            self.assertEqual(http_provider._yahoo_latest_level("%5EGSPC"), (5100.0, None))
+        self.assertEqual(get.call_count, 3)
+
+
+class YahooClosesTest(unittest.TestCase):
+    def test_extracts_non_null_closes(self) -> None:
+        payload = {"chart": {"result": [{"indicators": {"quote": [{"close": [2600.5, None, 2650.1]}]}}]}}
+        self.assertEqual(http_provider._yahoo_closes(payload), [2600.5, 2650.1])
+
+    def test_missing_result_raises_no_result(self) -> None:
+        for payload in ({}, {"chart": {"result": None}}, {"chart": {"result": [{"indicators": {}}]}}):
+            with self.assertRaisesRegex(RuntimeError, "no_result"):
+                http_provider._yahoo_closes(payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
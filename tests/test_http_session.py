@@ -0,0 +1,107 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+from requests.adapters import HTTPAdapter
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.tools import http_session
+from committee.tools.http_session import CircuitOpenError, pooled_session
+
+
+class PooledSessionTest(unittest.TestCase):
+    def test_adapters_are_sized_for_snapshot_fan_out(self) -> None:
+        session = pooled_session()
+        try:
+            for prefix in ("https://", "http://"):
+                adapter = session.get_adapter(f"{prefix}example.com")
+                self.assertEqual(adapter._pool_maxsize, 16)
+                self.assertEqual(adapter._pool_connections, 8)
+        finally:
+            session.close()
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_repeated_timeouts_open_circuit_for_host_only(self) -> None:
+        session = pooled_session()
+        try:
+            with mock.patch.object(HTTPAdapter, "send", side_effect=requests.ConnectTimeout) as send:
+                for _ in range(http_session._CIRCUIT_FAILURE_THRESHOLD):
+                    with self.assertRaises(requests.ConnectTimeout):
+                        session.get("https://dead.example.com/a")
+                with self.assertRaises(CircuitOpenError):
+                    session.get("https://dead.example.com/b")
+                self.assertEqual(send.call_count, http_session._CIRCUIT_FAILURE_THRESHOLD)
+                with self.assertRaises(requests.ConnectTimeout):
+                    session.get("https://alive.example.com/")
+        finally:
+            session.close()
+
+    def test_read_timeouts_on_one_series_do_not_block_another(self) -> None:
+        session = pooled_session()
+        ok = requests.Response()
+        ok.status_code = 200
+        slow = [requests.ReadTimeout] * (http_session._CIRCUIT_FAILURE_THRESHOLD + 1)
+        url = "https://api.example.com/fred/series/observations?series_id="
+        try:
+            with mock.patch.object(HTTPAdapter, "send", side_effect=[*slow, ok]) as send:
+                for _ in slow:
+                    with self.assertRaises(requests.ReadTimeout):
+                        session.get(url + "SLOW")
+                response = session.get(url + "CPIAUCSL")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(send.call_count, len(slow) + 1)
+        finally:
+            session.close()
+
+    def test_success_resets_failure_count(self) -> None:
+        session = pooled_session()
+        ok = requests.Response()
+        ok.status_code = 200
+        outcomes = [requests.ConnectTimeout, requests.ConnectTimeout, ok, requests.ConnectTimeout]
+        try:
+            with mock.patch.object(HTTPAdapter, "send", side_effect=outcomes):
+                for outcome in outcomes:
+                    if outcome is ok:
+                        session.get("https://flaky.example.com/")
+                    else:
+                        with self.assertRaises(requests.ConnectTimeout):
+                            session.get("https://flaky.example.com/")
+        finally:
+            session.close()
+
+    def test_circuit_closes_after_cooldown(self) -> None:
+        session = pooled_session()
+        adapter = session.get_adapter("https://dead.example.com")
+        adapter._circuit_state["dead.example.com"] = (3, 0.0)
+        try:
+            with mock.patch.object(HTTPAdapter, "send", side_effect=requests.ConnectTimeout) as send:
+                with self.assertRaises(requests.ConnectTimeout):
+                    session.get("https://dead.example.com/")
+                self.assertEqual(send.call_count, 1)
+                with self.assertRaises(CircuitOpenError):
+                    session.get("https://dead.example.com/")
+        finally:
+            session.close()
+
+
+class ResponseJsonTest(unittest.TestCase):
+    def test_decodes_bytes_with_and_without_orjson(self) -> None:
+        response = mock.Mock(content='{"rates": {"KRW": 1385.5}, "note": "원화"}'.encode())
+        expected = {"rates": {"KRW": 1385.5}, "note": "원화"}
+        self.assertEqual(http_session.response_json(response), expected)
+        with mock.patch.object(http_session, "orjson", None):
+            self.assertEqual(http_session.response_json(response), expected)
+
+    def test_invalid_body_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            http_session.response_json(mock.Mock(content=b"<html>"))
+
+
+if __name__ == "__main__":
+    unittest.main()
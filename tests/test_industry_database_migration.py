@@ -247,5 +247,19 @@ class IndustryDatabaseMigrationTests(unittest.TestCase):
             self.assertEqual(row["collected_at"], "2026-01-01T00:00:00")
 
 
+class ConnectJournalModeTests(unittest.TestCase):
+    def test_recreated_db_is_switched_to_wal_again(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            db_path = Path(td) / "investment.db"
+            with connect(db_path) as conn:
+                conn.execute("CREATE TABLE t (x INTEGER)")
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+            with connect(db_path) as conn:
+                mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+
 if __name__ == "__main__":
     unittest.main()
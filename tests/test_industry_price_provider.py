@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 import sys
 import unittest
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -12,6 +14,7 @@ from committee.industry_cycle.price_models import AssetPriceRecord
 from committee.tools.industry_price_provider import (
     IndustryPriceProvider,
     PriceFetchError,
+    YahooChartPriceProvider,
     _end_of_day_utc,
     safe_fetch_daily_prices,
 )
@@ -133,5 +136,44 @@ class AssetPriceRecordValidationTests(unittest.TestCase):
         self.assertEqual(record.adjustment_status, "unknown")
 
 
+class YahooChartPriceProviderTests(unittest.TestCase):
+    def _fetch(self, response: mock.Mock):
+        with mock.patch("requests.get", return_value=response):
+            return YahooChartPriceProvider().fetch_daily_prices(
+                asset_id="kospi", symbol="^KS11", market="KR", currency="KRW", start="2026-07-01", end="2026-07-02"
+            )
+
+    def test_parses_chart_payload_into_records(self) -> None:
+        payload = {
+            "chart": {
+                "result": [
+                    {
+                        "timestamp": [1782864000, 1782950400],
+                        "indicators": {
+                            "quote": [
+                                {
+                                    "open": [1.0, 2.0],
+                                    "high": [1.5, 2.5],
+                                    "low": [0.5, 1.5],
+                                    "close": [1.2, None],
+                                    "volume": [10, 20],
+                                }
+                            ],
+                            "adjclose": [{"adjclose": [1.1, None]}],
+                        },
+                    }
+                ]
+            }
+        }
+        records = self._fetch(mock.Mock(status_code=200, content=json.dumps(payload).encode()))
+        self.assertEqual(
+            [(r.trade_date, r.close_price, r.adj_close_price) for r in records], [("2026-07-01", 1.2, 1.1)]
+        )
+
+    def test_invalid_json_raises_price_fetch_error(self) -> None:
+        with self.assertRaisesRegex(PriceFetchError, r"^invalid_json\[\^KS11\]"):
+            self._fetch(mock.Mock(status_code=200, content=b"<html>"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,49 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.tools import macro_daily_provider
+
+
+class LatestCloseMemoTest(unittest.TestCase):
+    def setUp(self) -> None:
+        macro_daily_provider._CLOSE_CACHE.clear()
+
+    def tearDown(self) -> None:
+        macro_daily_provider._CLOSE_CACHE.clear()
+
+    def test_shared_symbols_are_fetched_once(self) -> None:
+        closes = {"^VIX": 15.0, "^VIX3M": 17.5}
+        with mock.patch.object(
+            macro_daily_provider, "_fetch_latest_close_uncached", side_effect=closes.get
+        ) as fetch:
+            self.assertEqual(macro_daily_provider.fetch_vix(), 15.0)
+            self.assertEqual(macro_daily_provider.fetch_vix3m(), 17.5)
+            self.assertEqual(macro_daily_provider.fetch_vix_term_spread(), 2.5)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_failures_are_not_cached(self) -> None:
+        with mock.patch.object(
+            macro_daily_provider, "_fetch_latest_close_uncached", side_effect=[None, 4321.0]
+        ) as fetch:
+            self.assertIsNone(macro_daily_provider.fetch_russell2000())
+            self.assertEqual(macro_daily_provider.fetch_russell2000(), 4321.0)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_expired_entries_are_refetched(self) -> None:
+        with mock.patch.object(
+            macro_daily_provider, "_fetch_latest_close_uncached", side_effect=[80.0, 81.0]
+        ) as fetch:
+            self.assertEqual(macro_daily_provider.fetch_oil_brent(), 80.0)
+            with mock.patch.object(macro_daily_provider.time, "monotonic", return_value=10**12):
+                self.assertEqual(macro_daily_provider.fetch_oil_brent(), 81.0)
+        self.assertEqual(fetch.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.tools import news_digest
+
+
+def _feed(count: int, tail: str = "</channel></rss>") -> bytes:
+    items = "".join(
+        f"<item><title>코스피 뉴스 {i}</title><link>https://news.example/{i}</link>"
+        "<pubDate>Mon, 01 Sep 2025 10:00:00 GMT</pubDate></item>"
+        for i in range(count)
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?><rss><channel><title>Feed</title>' + items + tail).encode()
+
+
+class RssItemParseTest(unittest.TestCase):
+    def test_collects_titled_items_with_links_and_dates(self) -> None:
+        items = news_digest._parse_rss_items(_feed(3), limit=10)
+        self.assertEqual([title for title, _, _ in items], ["코스피 뉴스 0", "코스피 뉴스 1", "코스피 뉴스 2"])
+        self.assertEqual(items[0][1], "https://news.example/0")
+        self.assertEqual(items[0][2].isoformat(), "2025-09-01T10:00:00+00:00")
+
+    def test_stops_reading_once_limit_is_reached(self) -> None:
+        # The feed is cut off after the items we need; streaming never reaches the broken tail.
+        items = news_digest._parse_rss_items(_feed(5, tail="<item><title>trunc"), limit=2)
+        self.assertEqual(len(items), 2)
+
+
+class ModuleSessionTest(unittest.TestCase):
+    def test_feed_fetch_goes_through_module_session(self) -> None:
+        response = mock.Mock(status_code=200, content=_feed(2))
+        with mock.patch.object(news_digest._SESSION, "get", return_value=response) as get:
+            items = news_digest.fetch_google_news_items("KOSPI", limit=5)
+        self.assertEqual(len(items), 2)
+        self.assertIs(get.call_args.kwargs["headers"], news_digest._DEFAULT_HEADERS)
+
+
+if __name__ == "__main__":
+    unittest.main()
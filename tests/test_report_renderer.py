@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from decimal import Decimal
+import json
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from pydantic import ValidationError
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.core.report_renderer import (
+    Report,
+    build_report,
+    build_report_markdown,
+    render_report,
+    write_report_markdown,
+)
+from report_fixtures import make_committee_result, make_snapshot, make_stance
+
+
+def _report(with_macro: bool = True) -> Report:
+    stances = [
+        make_stance("macro", "NEUTRAL", raw_response='{\n  "regime_tag": "NEUTRAL"\n}'),
+        make_stance("flow", "RISK_ON"),
+        make_stance("risk", "NEUTRAL"),
+    ]
+    return build_report("2026-08-07", make_snapshot(with_macro), stances, make_committee_result())
+
+
+class BuildReportMarkdownTests(unittest.TestCase):
+    def test_header_and_regime_vote(self) -> None:
+        markdown = build_report_markdown(_report())
+        lines = markdown.splitlines()
+        self.assertEqual(lines[0], "# 데일리 AI 투자위원회 리포트")
+        self.assertIn("- 시장 기준일: **2026-08-07**", lines)
+        self.assertIn("- **국면 투표**: NEUTRAL=2, RISK_ON=1, RISK_OFF=0", lines)
+        self.assertIn("- **다수 국면**: NEUTRAL", lines)
+        self.assertIn("- **위원회 합의**: 위원회는 선별적 포지셔닝을 전제로 중립적 입장을 유지합니다.", lines)
+
+    def test_majority_tag_tie_prefers_fixed_order(self) -> None:
+        report = build_report(
+            "2026-08-07",
+            make_snapshot(),
+            [make_stance("macro", "RISK_OFF"), make_stance("flow", "NEUTRAL"), make_stance("risk", "RISK_ON")],
+            make_committee_result(),
+        )
+        self.assertIn("- **다수 국면**: RISK_ON", build_report_markdown(report).splitlines())
+
+    def test_market_and_macro_lines(self) -> None:
+        lines = build_report_markdown(_report()).splitlines()
+        self.assertIn("- **국내 지수**: KOSPI -0.13% / KOSDAQ -0.99%", lines)
+        self.assertIn("- **환율/변동성**: USD/KRW 1423.62 (-0.12%) / VIX 15.1", lines)
+        self.assertIn("- **수급 요약**: 외국인 +1909억 / 기관 +786억 / 개인 -2401억", lines)
+        self.assertIn("- **일간 매크로**: 미10년 4.67% / 미2년 3.73% / 2-10 0.94%p / DXY 99.98", lines)
+        self.assertIn("- **월간 매크로**: 실업률 4.20% / CPI YoY 3.73% / Core CPI YoY n/a / PMI n/a", lines)
+
+    def test_unvalidated_numbers_are_coerced_or_rendered_na(self) -> None:
+        snapshot = make_snapshot()
+        # build_report skips validation, so odd value types can reach the formatters.
+        snapshot.markets.fx.usdkrw = "1423.62"
+        snapshot.markets.volatility.vix = Decimal("15.08")
+        snapshot.markets.kr.kospi_pct = "n/a"
+        report = build_report("2026-08-07", snapshot, [make_stance("macro", "NEUTRAL")], make_committee_result())
+        lines = build_report_markdown(report).splitlines()
+        self.assertIn("- **국내 지수**: KOSPI n/a / KOSDAQ -0.99%", lines)
+        self.assertIn("- **환율/변동성**: USD/KRW 1423.62 (-0.12%) / VIX 15.1", lines)
+
+    def test_macro_section_omitted_without_macro(self) -> None:
+        markdown = build_report_markdown(_report(with_macro=False))
+        self.assertNotIn("일간 매크로", markdown)
+        self.assertIn("- **수급 요약**: 외국인 +1909억 / 기관 +786억 / 개인 -2401억\n\n## 4) 위원회 핵심 포인트", markdown)
+
+    def test_key_points_disagreements_and_stances(self) -> None:
+        markdown = build_report_markdown(_report())
+        self.assertIn("- 다수 국면 태그: NEUTRAL.\n  ↳ 출처: `macro, risk`", markdown)
+        self.assertIn(
+            "- 국면 태그: 다수=NEUTRAL, 소수=RISK_ON, 에이전트=[flow]\n"
+            "  - 의미: 소수 의견 국면은 포지션 경계에 영향을 줄 수 있습니다.",
+            markdown,
+        )
+        self.assertIn(
+            "### 매크로 담당자\n- 한줄 요약: 거시는 균형적입니다.\n- 국면 태그: NEUTRAL / 신뢰도: MED\n"
+            "- 핵심 주장: Macro tone is balanced.\n- 핵심 주장: No major shocks.\n\n### 수급 담당자",
+            markdown,
+        )
+        self.assertIn("- 비활성화됨 (USE_AGENT_DEBATE=1 설정 시 활성화)", markdown)
+
+    def test_raw_response_section_omitted_by_default(self) -> None:
+        markdown = build_report_markdown(_report())
+        self.assertNotIn("## 8)", markdown)
+        self.assertTrue(markdown.endswith("  - 의미: 소수 의견 국면은 포지션 경계에 영향을 줄 수 있습니다."))
+
+    def test_raw_response_section_with_debug(self) -> None:
+        markdown = build_report_markdown(_report(), include_debug=True)
+        self.assertIn('### 매크로 담당자\n```text\n{\n  "regime_tag": "NEUTRAL"\n}\n```', markdown)
+        self.assertTrue(markdown.endswith("### 리스크 담당자\n(stub or raw response unavailable)"))
+
+
+class BuildReportTests(unittest.TestCase):
+    def test_build_report_reuses_validated_inputs(self) -> None:
+        snapshot = make_snapshot(True)
+        stances = [make_stance("macro", "NEUTRAL"), make_stance("flow", "RISK_ON")]
+        report = build_report("2026-08-07", snapshot, stances, make_committee_result())
+        self.assertIs(report.snapshot, snapshot)
+        self.assertIs(report.stances[0], stances[0])
+
+    def test_strict_validation_env_rejects_bad_inputs(self) -> None:
+        with mock.patch.dict("os.environ", {"REPORT_STRICT_VALIDATION": "1"}):
+            with self.assertRaises(ValidationError):
+                build_report("2026-08-07", {"bogus": True}, [], make_committee_result())
+
+
+class RenderReportTests(unittest.TestCase):
+    def test_render_report_round_trips(self) -> None:
+        report = _report()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "reports" / "2026-08-07.json"
+            render_report(report, path)
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(payload["market_date"], "2026-08-07")
+        self.assertEqual(payload["stances"][1]["regime_tag"], "RISK_ON")
+        self.assertEqual(Report.model_validate(payload), report)
+
+    def test_write_report_markdown_matches_built_string(self) -> None:
+        report = _report()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "report.md"
+            write_report_markdown(report, path)
+            written = path.read_text(encoding="utf-8")
+        self.assertEqual(written, build_report_markdown(report))
+
+    def test_report_is_frozen(self) -> None:
+        report = _report()
+        with self.assertRaises(ValidationError):
+            report.market_date = "2026-08-08"
+        self.assertEqual(report.model_copy(update={"market_date": "2026-08-08"}).market_date, "2026-08-08")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import sys
+import threading
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.core import snapshot_builder
+from committee.tools.providers import IDataProvider
+
+
+class _FakeProvider(IDataProvider):
+    def __init__(self, blocker: threading.Event | None = None) -> None:
+        self.blocker = blocker
+        self.usdkrw_calls = 0
+
+    def get_usdkrw(self):
+        self.usdkrw_calls += 1
+        if self.blocker is not None:
+            self.blocker.wait(5)
+        return 1400.5, None
+
+    def get_kospi_change_pct(self):
+        return 0.5, None
+
+    def get_kospi_level(self):
+        return 2600.0, None
+
+    def get_kosdaq_change_pct(self):
+        return -0.3, None
+
+    def get_kosdaq_level(self):
+        return 800.0, None
+
+    def get_sp500_change_pct(self):
+        return 0.2, None
+
+    def get_sp500_level(self):
+        return 5000.0, None
+
+    def get_nasdaq_change_pct(self):
+        return 0.4, None
+
+    def get_nasdaq_level(self):
+        return 16000.0, None
+
+    def get_dow_change_pct(self):
+        return -0.1, None
+
+    def get_dow_level(self):
+        return 39000.0, None
+
+    def get_usdkrw_pct(self):
+        return 0.05, None
+
+    def get_flows(self):
+        return {"foreign_net": 100.0, "institution_net": -50.0, "retail_net": -50.0}, None
+
+    def get_headlines(self, limit):
+        return ["earnings beat at Foo", "", "guidance up"], None
+
+
+class SnapshotBuilderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        snapshot_builder.clear_snapshot_cache()
+
+    def tearDown(self) -> None:
+        snapshot_builder.clear_snapshot_cache()
+
+    def _build(
+        self,
+        provider: IDataProvider,
+        refresh: bool = False,
+        market_date: date = date(2026, 1, 2),
+        **fetch_overrides,
+    ):
+        fetchers = [name for name in dir(snapshot_builder) if name.startswith("fetch_")]
+        patches = [
+            mock.patch.object(snapshot_builder, name, fetch_overrides.get(name, lambda *args: 1.0))
+            for name in fetchers
+        ]
+        patches.append(mock.patch.object(snapshot_builder, "_load_recent_market_rows", lambda **kwargs: []))
+        for patch in patches:
+            patch.start()
+        try:
+            return snapshot_builder.build_snapshot_real(market_date, provider=provider, refresh=refresh)
+        finally:
+            for patch in patches:
+                patch.stop()
+
+    def test_parallel_fetch_maps_each_provider_value(self) -> None:
+        snapshot = self._build(_FakeProvider())
+
+        self.assertEqual(snapshot.markets.kr.kospi_pct, 0.5)
+        self.assertEqual(snapshot.markets.kr.kosdaq_pct, -0.3)
+        self.assertEqual(snapshot.markets.us.sp500_pct, 0.2)
+        self.assertEqual(snapshot.markets.us.nasdaq_pct, 0.4)
+        self.assertEqual(snapshot.markets.us.dow_pct, -0.1)
+        self.assertEqual(snapshot.markets.fx.usdkrw, 1400.5)
+        self.assertEqual(snapshot.flow_summary.foreign_net, 100.0)
+        self.assertEqual(snapshot.news_headlines, ["earnings beat at Foo", "guidance up"])
+        self.assertEqual(snapshot_builder.get_last_snapshot_status()["usdkrw"], "OK")
+
+    def test_slow_fetch_falls_back_after_deadline(self) -> None:
+        blocker = threading.Event()
+        try:
+            with mock.patch.dict("os.environ", {"SNAPSHOT_FETCH_TIMEOUT_SECS": "0.2"}):
+                snapshot = self._build(_FakeProvider(blocker))
+        finally:
+            blocker.set()
+
+        self.assertEqual(snapshot.markets.fx.usdkrw, 0.0)
+        self.assertEqual(snapshot.markets.us.sp500_pct, 0.2)
+        self.assertEqual(snapshot_builder.get_last_snapshot_status()["usdkrw"], "FAIL")
+
+    def test_slow_macro_fetch_is_stored_as_missing(self) -> None:
+        blocker = threading.Event()
+        try:
+            with mock.patch.dict("os.environ", {"SNAPSHOT_FETCH_TIMEOUT_SECS": "0.2"}):
+                snapshot = self._build(_FakeProvider(), fetch_pmi=lambda: blocker.wait(5) and 50.0)
+        finally:
+            blocker.set()
+
+        status = snapshot_builder.get_last_snapshot_status()
+        self.assertIsNone(snapshot.macro.monthly.pmi)
+        self.assertEqual(status["pmi"], "FAIL")
+        self.assertEqual(status["cpi_yoy"], "OK")
+        self.assertEqual(snapshot.macro.structural.real_rate, 0.0)
+
+    def test_same_day_repeat_is_served_from_cache(self) -> None:
+        provider = _FakeProvider()
+        first = self._build(provider)
+        first.market_summary.note = "mutated by caller"
+        second = self._build(provider)
+
+        self.assertEqual(provider.usdkrw_calls, 1)
+        self.assertNotEqual(second.market_summary.note, "mutated by caller")
+        self.assertEqual(snapshot_builder.get_last_snapshot_status()["usdkrw"], "OK")
+
+        self._build(provider, refresh=True)
+        self.assertEqual(provider.usdkrw_calls, 2)
+
+    def test_build_with_failures_is_not_cached(self) -> None:
+        provider = _FakeProvider()
+        self._build(provider, fetch_pmi=lambda: None)
+        self._build(provider)
+        self._build(provider)
+
+        self.assertEqual(provider.usdkrw_calls, 2)
+        self.assertEqual(snapshot_builder.get_last_snapshot_status()["pmi"], "OK")
+
+    def test_cached_entry_expires_after_ttl(self) -> None:
+        provider = _FakeProvider()
+        self._build(provider)
+        with mock.patch.object(snapshot_builder, "_SNAPSHOT_CACHE_TTL_SECS", 0.0):
+            self._build(provider, refresh=True)
+        self._build(provider)
+
+        self.assertEqual(provider.usdkrw_calls, 3)
+
+    def test_refresh_evicts_only_its_own_date(self) -> None:
+        provider = _FakeProvider()
+        self._build(provider, market_date=date(2026, 1, 2))
+        self._build(provider, market_date=date(2026, 1, 5))
+        self._build(provider, refresh=True, market_date=date(2026, 1, 5))
+        self._build(provider, market_date=date(2026, 1, 2))
+
+        self.assertEqual(provider.usdkrw_calls, 3)
+
+    def test_last_status_is_read_only_per_build(self) -> None:
+        self._build(_FakeProvider())
+        status = snapshot_builder.get_last_snapshot_status()
+        with self.assertRaises(TypeError):
+            status["usdkrw"] = "FAIL"  # type: ignore[index]
+
+        blocker = threading.Event()
+        try:
+            with mock.patch.dict("os.environ", {"SNAPSHOT_FETCH_TIMEOUT_SECS": "0.2"}):
+                self._build(_FakeProvider(blocker), refresh=True)
+        finally:
+            blocker.set()
+        self.assertEqual(status["usdkrw"], "OK")
+        self.assertEqual(snapshot_builder.get_last_snapshot_status()["usdkrw"], "FAIL")
+
+    def test_cached_entry_keeps_its_own_build_status(self) -> None:
+        # Another build finishing in between must not leak its status into this date's cache entry.
+        def build_then_publish_other_status(market_date, provider):
+            snapshot, status = uncached(market_date, provider)
+            snapshot_builder._set_last_status({"usdkrw": "FAIL"})
+            return snapshot, status
+
+        uncached = snapshot_builder._build_snapshot_uncached
+        provider = _FakeProvider()
+        with mock.patch.object(snapshot_builder, "_build_snapshot_uncached", build_then_publish_other_status):
+            self._build(provider)
+        self.assertEqual(snapshot_builder.get_last_snapshot_status()["usdkrw"], "OK")
+
+        snapshot_builder._set_last_status({"usdkrw": "FAIL"})
+        self._build(provider)
+        self.assertEqual(provider.usdkrw_calls, 1)
+        self.assertEqual(snapshot_builder.get_last_snapshot_status()["usdkrw"], "OK")
+
+    def test_concurrent_build_on_another_thread_keeps_own_status(self) -> None:
+        self._build(_FakeProvider())
+
+        worker = threading.Thread(target=snapshot_builder._set_last_status, args=({"usdkrw": "FAIL"},))
+        worker.start()
+        worker.join()
+
+        self.assertEqual(snapshot_builder.get_last_snapshot_status()["usdkrw"], "OK")
+        self.assertEqual(snapshot_builder._LAST_STATUS["usdkrw"], "FAIL")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import json
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.core.report_renderer import build_report
+from committee.core.storage import save_run
+from report_fixtures import make_committee_result, make_snapshot, make_stance
+
+
+class SaveRunTest(unittest.TestCase):
+    def test_artifacts_match_stdlib_json_layout(self) -> None:
+        snapshot = make_snapshot()
+        stances = [make_stance("macro", "NEUTRAL"), make_stance("flow", "RISK_ON")]
+        result = make_committee_result()
+        report = build_report("2026-08-07", snapshot, stances, result)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            run_dir = save_run(Path(tmp), date(2026, 8, 7), snapshot, stances, result, report)
+            written = {
+                name: (run_dir / name).read_text(encoding="utf-8")
+                for name in ("snapshot.json", "stances.json", "committee_result.json")
+            }
+            self.assertFalse((run_dir / "debate_round.json").exists())
+            self.assertTrue((run_dir / "report.md").exists())
+
+        expected = {
+            "snapshot.json": snapshot.model_dump(),
+            "stances.json": [stance.model_dump() for stance in stances],
+            "committee_result.json": result.model_dump(),
+        }
+        for name, payload in expected.items():
+            self.assertEqual(written[name], json.dumps(payload, ensure_ascii=False, indent=2), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import gc
+import json
+from pathlib import Path
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.core import trace_logger
+from committee.core.trace_logger import TraceLogger
+
+
+class TraceLoggerTests(unittest.TestCase):
+    def test_disabled_logger_is_noop(self) -> None:
+        trace = TraceLogger(None)
+        self.assertFalse(trace.enabled())
+        self.assertIsNone(trace.log("pipeline_stage", {"stage": "snapshot_built"}))
+
+    def test_enabled_logger_appends_jsonl(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "traces" / "llm_traces.jsonl"
+            trace = TraceLogger(path)
+            trace.log("pipeline_stage", {"stage": "snapshot_built"})
+            trace.log("pipeline_stage", {"stage": "한글"})
+            lines = path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+        first = json.loads(lines[0])
+        self.assertEqual(first["event"], "pipeline_stage")
+        self.assertEqual(first["stage"], "snapshot_built")
+        self.assertIn("ts", first)
+        self.assertEqual(json.loads(lines[1])["stage"], "한글")
+
+    def test_handle_is_reused_and_reopened_after_close(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "llm_traces.jsonl"
+            with TraceLogger(path) as trace:
+                trace.log("a", {})
+                handle = trace._handle
+                trace.log("b", {})
+                self.assertIs(trace._handle, handle)
+                trace.close()
+                self.assertIsNone(trace._handle)
+                trace.log("c", {})
+            events = [json.loads(line)["event"] for line in path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(events, ["a", "b", "c"])
+
+    def test_failed_init_finalizes_quietly(self) -> None:
+        with mock.patch("sys.unraisablehook") as hook:
+            with self.assertRaises(TypeError):
+                TraceLogger(object())  # type: ignore[arg-type]
+            gc.collect()
+        hook.assert_not_called()
+
+    def test_stdlib_fallback_writes_same_records(self) -> None:
+        record = {"event": "llm_call", "agent": "매크로", "tokens": {1: 10}}
+        with mock.patch.object(trace_logger, "orjson", None):
+            fallback = trace_logger._encode_line(record)
+        self.assertEqual(json.loads(fallback), json.loads(trace_logger._encode_line(record)))
+        self.assertTrue(fallback.endswith(b"\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+from committee.core import validators
+
+
+class ForbiddenPhraseTest(unittest.TestCase):
+    def test_detects_phrase_in_any_text(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Forbidden phrase detected: 확정 수익"):
+            validators._assert_no_forbidden_phrases(["시장 중립", "이번 분기 확정 수익 기대"])
+
+    def test_matching_ignores_case(self) -> None:
+        with mock.patch.object(
+            validators, "_FORBIDDEN_PHRASE_PATTERN", validators.re.compile("guaranteed profit", validators.re.IGNORECASE)
+        ), mock.patch.dict(validators._FORBIDDEN_PHRASE_BY_LOWER, {"guaranteed profit": "Guaranteed Profit"}):
+            with self.assertRaisesRegex(ValueError, "Forbidden phrase detected: Guaranteed Profit"):
+                validators._assert_no_forbidden_phrases(["a GUARANTEED profit"])
+
+    def test_phrase_split_across_fields_is_not_matched(self) -> None:
+        validators._assert_no_forbidden_phrases(["확정", "수익"])
+        validators._assert_no_forbidden_phrases([])
+
+
+class UnknownTickerTest(unittest.TestCase):
+    def test_allows_watchlist_and_known_tokens(self) -> None:
+        validators._assert_no_unknown_tickers(["AAPL beat; KOSPI flat", "STK flows OK"], ["aapl"])
+
+    def test_reports_first_unknown_ticker(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Ticker 'TSLA' not found"):
+            validators._assert_no_unknown_tickers(["KOSPI up", "TSLA and NVDA rally"], ["AAPL"])
+
+    def test_short_alphanumeric_tokens_are_still_checked(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Ticker 'A1' not found"):
+            validators._assert_no_unknown_tickers(["시장 중립", "A1 급등"], ["AAPL"])
+        validators._assert_no_unknown_tickers(["시장 중립", "금리 안정"], [])
+
+    def test_tokens_do_not_merge_across_fields(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Ticker 'AB' not found"):
+            validators._assert_no_unknown_tickers(["AB", "CD"], ["ABCD"])
+
+
+def _stance_payload(**overrides) -> dict:
+    payload = {
+        "agent_name": "macro",
+        "core_claims": ["금리 안정"],
+        "korean_comment": "중립 유지",
+        "regime_tag": "NEUTRAL",
+        "evidence_ids": ["snapshot.markets.volatility.vix"],
+        "confidence": "MED",
+    }
+    payload.update(overrides)
+    return payload
+
+
+class ValidateStancesTest(unittest.TestCase):
+    def test_validates_dicts_and_models_together(self) -> None:
+        first = validators.validate_stances([_stance_payload()])[0]
+        stances = validators.validate_stances([first, _stance_payload(agent_name="risk")])
+        self.assertIs(stances[0], first)
+        self.assertEqual([stance.agent_name.value for stance in stances], ["macro", "risk"])
+
+    def test_schema_errors_become_value_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            validators.validate_stances([_stance_payload(), _stance_payload(core_claims=[])])
+
+    def test_rejects_unknown_evidence_ids_and_empty_lists(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Invalid evidence_ids"):
+            validators.validate_stances([_stance_payload(evidence_ids=["snapshot.unknown_field"])])
+        with self.assertRaisesRegex(ValueError, "At least one stance"):
+            validators.validate_stances(iter([]))
+
+
+if __name__ == "__main__":
+    unittest.main()